@@ -53,11 +53,12 @@ _TYPE_MAP: dict[type, str] = {
 
 
 def _type_code(value: Any) -> str:
-    """Return the _T type code for a value, or empty string if text/unknown."""
-    if isinstance(value, bool):
-        return "B"
-    t = type(value)
-    code = _TYPE_MAP.get(t, "")
+    """Return the _T type code for a value, or empty string if text/unknown.
+
+    A single lookup on the exact type: bool cannot be subclassed, so it
+    never falls through to the int entry.
+    """
+    code = _TYPE_MAP.get(type(value), "")
     if code == "T":
         return ""
     return code
@@ -118,7 +118,9 @@ class Bag(BagPopulate, BagTraverse, BagEvents, BagRepr, BagParser, BagSerializer
         self._root_attributes: dict | None = None
 
         if source:
-            self.fill_from(source)
+            # A fresh Bag has no content, subscribers or backref to protect:
+            # populate it in place, without fill_from's orphan-and-swap step.
+            self._populate_into(self, source)
 
     # -------------------- transaction --------------------------------
 
@@ -150,7 +152,7 @@ class Bag(BagPopulate, BagTraverse, BagEvents, BagRepr, BagParser, BagSerializer
         finally:
             _current_transaction.reset(token)
             if completed and mutations:
-                for sub in list(self._txn_subscribers.values()):
+                for sub in self._txn_subscribers.values():
                     sub(bag=self, mutations=mutations)
 
     # -------------------- properties --------------------------------
@@ -197,14 +199,22 @@ class Bag(BagPopulate, BagTraverse, BagEvents, BagRepr, BagParser, BagSerializer
 
         Returns the dot-separated path from the root of the hierarchy to this
         Bag. Returns None if backref mode is not enabled or if this is the root.
+
+        Not cached, like root: labels are collected in one walk up the parent
+        chain and joined once, instead of rebuilding the prefix per level.
         """
-        if self.parent is not None and self.parent_node is not None:
-            parent_fullpath = self.parent.fullpath
-            if parent_fullpath:
-                return f"{parent_fullpath}.{self.parent_node.label}"
-            else:
-                return self.parent_node.label
-        return None
+        labels = []
+        curr = self
+        while curr._parent is not None and curr._parent_node is not None:
+            labels.append(str(curr._parent_node.label))
+            curr = curr._parent
+        if not labels:
+            return None
+        labels.reverse()
+        # An empty path above a level is dropped, not joined as a leading '.'
+        while len(labels) > 1 and not labels[0]:
+            del labels[0]
+        return ".".join(labels)
 
     def relative_path(self, node: BagNode) -> str | None:
         """Get dot-separated path from this Bag to a descendant node.
@@ -236,10 +246,15 @@ class Bag(BagPopulate, BagTraverse, BagEvents, BagRepr, BagParser, BagSerializer
 
         Traverses parent chain until reaching a Bag with no parent.
         Returns self if this is already the root.
+
+        Not cached: re-parenting any ancestor would have to invalidate the
+        whole subtree, while the walk itself is one attribute read per level.
         """
         curr = self
-        while curr.parent is not None:
-            curr = curr.parent
+        parent = curr._parent
+        while parent is not None:
+            curr = parent
+            parent = curr._parent
         return curr
 
     @property
@@ -461,10 +476,9 @@ class Bag(BagPopulate, BagTraverse, BagEvents, BagRepr, BagParser, BagSerializer
             >>> bag['data'] = BagCbResolver(lambda: 'computed')
             >>> bag.set_item('data', 'new', resolver=False)  # Remove resolver
         """
-        # Merge kwargs into _attributes
+        # Merge kwargs into _attributes (kwargs is already a fresh dict)
         if kwargs:
-            _attributes = dict(_attributes or {})
-            _attributes.update(kwargs)
+            _attributes = kwargs if not _attributes else {**_attributes, **kwargs}
 
         # Traverse path (write_mode=True guarantees label is str)
         result, label = self._htraverse(path, write_mode=True)
@@ -860,7 +874,7 @@ class Bag(BagPopulate, BagTraverse, BagEvents, BagRepr, BagParser, BagSerializer
             1
         """
         if not what:
-            return list(self.keys())
+            return self.keys()
         return self[what]
 
     def __contains__(self, what: str) -> bool:
@@ -63,13 +63,14 @@ class BagEvents:
         if txn is not None:
             txn.append(("upd", node, pathlist, evt, oldvalue, attrs_diff, reason))
             return
-        for s in list(self._upd_subscribers.values()):
-            if s(
-                node=node, pathlist=pathlist,
-                oldvalue=oldvalue, attrs_diff=attrs_diff,
-                evt=evt, reason=reason,
-            ) is False:
-                return
+        if self._upd_subscribers:
+            for s in self._upd_subscribers.values():
+                if s(
+                    node=node, pathlist=pathlist,
+                    oldvalue=oldvalue, attrs_diff=attrs_diff,
+                    evt=evt, reason=reason,
+                ) is False:
+                    return
         if self.parent and self.parent_node:
             self.parent._on_node_changed(
                 node, [self.parent_node.label] + pathlist,
@@ -97,9 +98,10 @@ class BagEvents:
         if txn is not None:
             txn.append(("ins", node, pathlist, ind, reason))
             return
-        for s in list(self._ins_subscribers.values()):
-            if s(node=node, pathlist=pathlist, ind=ind, evt="ins", reason=reason) is False:
-                return
+        if self._ins_subscribers:
+            for s in self._ins_subscribers.values():
+                if s(node=node, pathlist=pathlist, ind=ind, evt="ins", reason=reason) is False:
+                    return
         if self.parent and self.parent_node:
             self.parent._on_node_inserted(
                 node, ind, [self.parent_node.label] + pathlist, reason=reason
@@ -119,9 +121,10 @@ class BagEvents:
         if txn is not None:
             txn.append(("del", node, pathlist if pathlist is not None else [], ind, reason))
             return
-        for s in list(self._del_subscribers.values()):
-            if s(node=node, pathlist=pathlist, ind=ind, evt="del", reason=reason) is False:
-                return
+        if self._del_subscribers:
+            for s in self._del_subscribers.values():
+                if s(node=node, pathlist=pathlist, ind=ind, evt="del", reason=reason) is False:
+                    return
         if self.parent and self.parent_node:
             if pathlist is None:
                 pathlist = []
@@ -153,10 +156,23 @@ class BagEvents:
 
     # -------------------- subscription --------------------------------
 
-    def _subscribe(self, subscriber_id: str, subscribers_dict: dict, callback: Any) -> None:
-        """Internal subscribe helper."""
-        if callback is not None:
-            subscribers_dict[subscriber_id] = callback
+    def _subscribe(self, subscriber_id: str, subscribers_dict: dict, callback: Any) -> dict:
+        """Internal subscribe helper, returns the subscribers dict to store.
+
+        Subscriber dicts are copy-on-write: a new dict replaces the old one
+        instead of mutating it. Dispatch can then iterate the stored dict
+        directly, with no per-event snapshot, and a callback that subscribes
+        or unsubscribes mid-dispatch leaves the running loop untouched.
+        """
+        if callback is None:
+            return subscribers_dict
+        return {**subscribers_dict, subscriber_id: callback}
+
+    def _unsubscribe(self, subscriber_id: str, subscribers_dict: dict) -> dict:
+        """Internal unsubscribe helper, copy-on-write counterpart of _subscribe."""
+        if subscriber_id not in subscribers_dict:
+            return subscribers_dict
+        return {k: v for k, v in subscribers_dict.items() if k != subscriber_id}
 
     def subscribe(
         self,
@@ -187,10 +203,10 @@ class BagEvents:
         """
         if not self.backref:
             self.set_backref()
-        self._subscribe(subscriber_id, self._upd_subscribers, update or any)
-        self._subscribe(subscriber_id, self._ins_subscribers, insert or any)
-        self._subscribe(subscriber_id, self._del_subscribers, delete or any)
-        self._subscribe(subscriber_id, self._txn_subscribers, transaction)
+        self._upd_subscribers = self._subscribe(subscriber_id, self._upd_subscribers, update or any)
+        self._ins_subscribers = self._subscribe(subscriber_id, self._ins_subscribers, insert or any)
+        self._del_subscribers = self._subscribe(subscriber_id, self._del_subscribers, delete or any)
+        self._txn_subscribers = self._subscribe(subscriber_id, self._txn_subscribers, transaction)
 
         if timer is not None:
             if interval is None:
@@ -225,14 +241,14 @@ class BagEvents:
             transaction: Remove transaction subscription.
         """
         if update or any:
-            self._upd_subscribers.pop(subscriber_id, None)
+            self._upd_subscribers = self._unsubscribe(subscriber_id, self._upd_subscribers)
         if insert or any:
-            self._ins_subscribers.pop(subscriber_id, None)
+            self._ins_subscribers = self._unsubscribe(subscriber_id, self._ins_subscribers)
         if delete or any:
-            self._del_subscribers.pop(subscriber_id, None)
+            self._del_subscribers = self._unsubscribe(subscriber_id, self._del_subscribers)
         if timer or any:
             entry = self._tmr_subscribers.pop(subscriber_id, None)
             if entry:
                 cancel_timer(entry["timer_id"])
         if transaction:
-            self._txn_subscribers.pop(subscriber_id, None)
+            self._txn_subscribers = self._unsubscribe(subscriber_id, self._txn_subscribers)
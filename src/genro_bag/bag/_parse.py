@@ -12,13 +12,14 @@ class, so cls() creates a new Bag instance.
 from __future__ import annotations
 
 import datetime
-import io
 import re
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal
 from xml import sax
+from xml.parsers import expat
 from xml.sax import saxutils
 from xml.sax.handler import ContentHandler
+from xml.sax.xmlreader import Locator
 
 from genro_tytx import from_tytx as tytx_decode
 
@@ -59,7 +60,8 @@ class BagParser:
         Supports environment variable substitution for {GNR_*} placeholders.
 
         Args:
-            source: XML string or bytes to parse.
+            source: XML string or bytes to parse. Bytes are decoded by the
+                parser according to the XML declaration (UTF-8 by default).
             empty: Factory function for empty element values. Called when an
                 element has no content and no type marker.
             raise_on_error: If True, raise exceptions for type conversion errors.
@@ -93,17 +95,25 @@ class BagParser:
         handler = _BagXmlHandler(
             cls, empty=empty, raise_on_error=raise_on_error, tag_attribute=tag_attribute
         )
-        if isinstance(source, bytes):
-            source = source.decode()
-
-        # Create secure parser (disable DTD and external entities to prevent XXE)
-        parser = sax.make_parser()
-        parser.setContentHandler(handler)
-        parser.setFeature(sax.handler.feature_external_ges, False)
-        parser.setFeature(sax.handler.feature_external_pes, False)
-        input_source = sax.xmlreader.InputSource()
-        input_source.setCharacterStream(io.StringIO(source))
-        parser.parse(input_source)
+        # Drive the handler straight from expat: the SAX reader would add a
+        # Python adapter frame and an AttributesImpl per element. External
+        # entities are skipped, never fetched (prevents XXE), as the SAX
+        # reader does with feature_external_ges/pes turned off. Bytes are
+        # fed as they are: expat decodes them in C, honouring the XML
+        # declaration's encoding (UTF-8 by default).
+        parser = expat.ParserCreate()
+        parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_UNLESS_STANDALONE)
+        parser.ExternalEntityRefHandler = _skip_external_entity
+        parser.StartElementHandler = handler.startElement
+        parser.EndElementHandler = handler.endElement
+        parser.CharacterDataHandler = handler.characters
+        handler.startDocument()
+        try:
+            parser.Parse(source, True)
+        except expat.ExpatError as e:
+            raise sax.SAXParseException(
+                expat.ErrorString(e.code), e, _ExpatLocator(parser)
+            ) from None
 
         result = handler.bags[0][0]
         if handler.legacy_mode:
@@ -262,6 +272,41 @@ class BagParser:
 # =============================================================================
 
 
+# First characters of a string json.loads could accept (whitespace included:
+# leading blanks are allowed; N/I for NaN/Infinity with the stdlib decoder)
+_JSON_START = frozenset(' \t\n\r{["-0123456789tfnNI')
+
+
+def _decode_attr(value: str) -> Any:
+    """Decode an XML attribute value through TYTX.
+
+    Values with no '::' suffix that cannot start a JSON literal come back
+    unchanged from tytx_decode (after a failed JSON parse), so they are
+    returned as-is without the attempt.
+    """
+    if "::" in value or (value and value[0] in _JSON_START):
+        return tytx_decode(value)
+    return value
+
+
+def _skip_external_entity(*args: Any) -> int:
+    """Expat ExternalEntityRefHandler that skips the entity without loading it."""
+    return 1
+
+
+class _ExpatLocator(Locator):
+    """Locator reporting the error position of an expat parser."""
+
+    def __init__(self, parser: Any):
+        self._parser = parser
+
+    def getColumnNumber(self) -> int:
+        return self._parser.ErrorColumnNumber  # type: ignore[no-any-return]
+
+    def getLineNumber(self) -> int:
+        return self._parser.ErrorLineNumber  # type: ignore[no-any-return]
+
+
 class _BagXmlHandler(ContentHandler):
     """SAX handler for parsing XML into Bag.
 
@@ -274,7 +319,9 @@ class _BagXmlHandler(ContentHandler):
         empty: Optional factory for empty element values.
         raise_on_error: If True, raise on type conversion errors.
         tag_attribute: If set, use this attribute's value as node label.
-        bags: Stack of (bag, attrs, type) tuples during parsing.
+        bags: Stack of (bag, attrs, type) tuples during parsing. The bag slot
+            stays None until the element gets a child, so leaf elements never
+            allocate a Bag.
         value_list: Accumulator for character data between tags.
         legacy_mode: True if parsing GenRoBag format with _T type markers.
     """
@@ -302,7 +349,7 @@ class _BagXmlHandler(ContentHandler):
         """Join accumulated character data, strip newlines, unescape XML entities."""
         if self.value_list:
             if self.value_list[0] == "\n":
-                self.value_list[:] = self.value_list[1:]
+                del self.value_list[0]
             if self.value_list and self.value_list[-1] == "\n":
                 self.value_list.pop()
         value = "".join(self.value_list)
@@ -312,7 +359,7 @@ class _BagXmlHandler(ContentHandler):
 
     def startElement(self, tag_label: str, attributes: Any) -> None:
         """Push new Bag onto stack, detect legacy format on first element."""
-        attrs = {str(k): tytx_decode(saxutils.unescape(v)) for k, v in attributes.items()}
+        attrs = {str(k): _decode_attr(saxutils.unescape(v)) for k, v in attributes.items()}
         curr_type: str | None = None
 
         if len(self.bags) == 1:
@@ -325,12 +372,20 @@ class _BagXmlHandler(ContentHandler):
                 # Plain XML - handle mixed content
                 value = self._get_value()
                 if value:
-                    self.bags[-1][0].set_item("_", value)
+                    self._current_bag().set_item("_", value)
 
-        self.bags.append((self.bag_class(), attrs, curr_type))
+        self.bags.append((None, attrs, curr_type))
 
         self.value_list = []
 
+    def _current_bag(self) -> Any:
+        """Return the Bag of the innermost open element, creating it on demand."""
+        bag, attrs, curr_type = self.bags[-1]
+        if bag is None:
+            bag = self.bag_class()
+            self.bags[-1] = (bag, attrs, curr_type)
+        return bag
+
     def characters(self, s: str) -> None:
         """Accumulate text content between tags."""
         self.value_list.append(s)
@@ -375,7 +430,7 @@ class _BagXmlHandler(ContentHandler):
 
     def _set_into_parent(self, tag_label: str, curr: Any, attrs: dict) -> None:
         """Add node to parent Bag, handling label from attrs and duplicates."""
-        dest = self.bags[-1][0]
+        dest = self._current_bag()
 
         # Use _tag attribute as label if present, keep original as xml_tag
         original_xml_tag = tag_label
@@ -395,7 +450,13 @@ class _BagXmlHandler(ContentHandler):
         if cnt:
             tag_label = f"{tag_label}_{cnt}"
 
-        if attrs:
+        if isinstance(tag_label, str) and "." not in tag_label:
+            # Single segment into a Bag built by this parser (no subscribers):
+            # insert straight into the container, skipping set_item.
+            node = dest._nodes.set(
+                tag_label, curr, attr=attrs or None, parent_bag=dest, do_trigger=False
+            )
+        elif attrs:
             node = dest.set_item(tag_label, curr, _attributes=attrs)
         else:
             node = dest.set_item(tag_label, curr)
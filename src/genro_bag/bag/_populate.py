@@ -20,6 +20,13 @@ if TYPE_CHECKING:
 
 _IS_BAG = "genro_bag.bag._core.Bag"
 
+# File suffix -> transport, checked in order by _fill_from_file
+_FILE_TRANSPORTS = (
+    (".bag.json", "json"),
+    (".bag.mp", "msgpack"),
+    (".xml", "xml"),
+)
+
 
 class BagPopulate:
     """Mixin providing population, copy, pickle and update methods for Bag.
@@ -178,16 +185,12 @@ class BagPopulate:
 
         # Determine transport: explicit or from extension
         if transport is None:
-            if path.endswith(".bag.json"):
-                transport = "json"
-            elif path.endswith(".bag.mp"):
-                transport = "msgpack"
-            elif path.endswith(".xml"):
-                transport = "xml"
-            else:
-                raise ValueError(
-                    f"Unrecognized file extension: {path}. Supported: .bag.json, .bag.mp, .xml"
-                )
+            transport = next(
+                (name for suffix, name in _FILE_TRANSPORTS if path.endswith(suffix)), None
+            )
+            if transport is None:
+                supported = ", ".join(suffix for suffix, _name in _FILE_TRANSPORTS)
+                raise ValueError(f"Unrecognized file extension: {path}. Supported: {supported}")
 
         # Load based on transport
         cls = self.__class__
@@ -195,13 +198,13 @@ class BagPopulate:
             with open(path, encoding="utf-8") as f:
                 data = f.read()
             loaded = cls.from_tytx(data, transport="json")
-            self._fill_from_bag(loaded, target)
+            self._adopt_nodes(loaded, target)
 
         elif transport == "msgpack":
             with open(path, "rb") as f:
                 data_bytes = f.read()
             loaded = cls.from_tytx(data_bytes, transport="msgpack")
-            self._fill_from_bag(loaded, target)
+            self._adopt_nodes(loaded, target)
 
         elif transport == "xml":
             with open(path, encoding="utf-8") as f:
@@ -209,23 +212,45 @@ class BagPopulate:
             loaded = cls.from_xml(data)
             self._fill_from_bag(loaded, target)
 
+    def _adopt_nodes(self, loaded: Bag, target: Bag) -> None:
+        """Move the nodes of a freshly decoded Bag into target, without copying.
+
+        Used when loaded was just built by a decoder and is referenced by
+        nobody else: its node container is swapped into target instead of
+        deep-copying every nested Bag as _fill_from_bag does. Both Bags are
+        orphan here (no backref), so re-pointing _parent_bag fires no event.
+
+        Args:
+            loaded: Throwaway Bag produced by a decoder (from_tytx).
+            target: Bag to populate.
+        """
+        target.clear()
+        target._nodes, loaded._nodes = loaded._nodes, target._nodes
+        for node in target._nodes:
+            node._parent_bag = target
+
     def _fill_from_bag(self, other: Bag, target: Bag) -> None:
         """Copy nodes from another Bag into target.
 
         Clears target's current contents first and copies all nodes from the
-        source Bag.
+        source Bag. Source labels are single path segments and target is a
+        fresh or orphan Bag, so nodes go straight into target's container
+        without path traversal or event dispatch.
 
         Args:
             other: Source Bag to copy from.
             target: Bag to populate.
         """
         target.clear()
+        nodes = target._nodes
         for node in other:
             # Deep copy the value if it's a Bag
             value = node.value
             if safe_is_instance(value, _IS_BAG):
                 value = value.deepcopy()
-            target.set_item(node.label, value, **dict(node.attr))
+            nodes.set(
+                node.label, value, attr=dict(node.attr), parent_bag=target, do_trigger=False
+            )
 
     def _fill_from_dict(
         self, data: dict[str, Any], target: Bag
@@ -235,15 +260,24 @@ class BagPopulate:
         Clears target's current contents first and creates nodes from dict items.
         Nested dicts are converted to nested Bags.
 
+        Plain labels (no '.') are inserted straight into the node container,
+        skipping path traversal; target is always a fresh or orphan Bag here,
+        so there are no subscribers to notify. Dotted keys still go through
+        set_item and create the intermediate levels.
+
         Args:
             data: Dict where keys become labels and values become node values.
             target: Bag to populate.
         """
         target.clear()
+        nodes = target._nodes
         for key, value in data.items():
             if isinstance(value, dict):
                 value = self.__class__(value)
-            target.set_item(key, value)
+            if isinstance(key, str) and "." not in key:
+                nodes.set(key, value, parent_bag=target, do_trigger=False)
+            else:
+                target.set_item(key, value)
 
     # -------------------- class methods --------------------------------
 
@@ -297,8 +331,9 @@ class BagPopulate:
         """Return a deep copy of this Bag.
 
         Creates a new Bag with copies of all nodes. Nested Bags are
-        recursively deep copied. Values are copied by reference unless
-        they are Bags. Node attributes are copied as a new dict.
+        deep copied (iteratively, so depth is not bound by the recursion
+        limit). Values are copied by reference unless they are Bags.
+        Node attributes are copied as a new dict.
 
         Returns:
             A new Bag with copied nodes.
@@ -311,11 +346,22 @@ class BagPopulate:
             2
         """
         result = self.__class__()
-        for node in self:
-            value = node.static_value
-            if safe_is_instance(value, _IS_BAG):
-                value = value.deepcopy()
-            result.set_item(node.label, value, _attributes=dict(node.attr))
+        # Iterative walk over (source, copy) pairs: only the Bag spines are
+        # rebuilt, leaf values are shared. The copies are fresh Bags without
+        # subscribers, so nodes go straight into the container.
+        stack = [(self, result)]
+        while stack:
+            source, target = stack.pop()
+            nodes = target._nodes
+            for node in source._nodes:
+                value = node.static_value
+                if safe_is_instance(value, _IS_BAG):
+                    sub = value.__class__()
+                    stack.append((value, sub))
+                    value = sub
+                nodes.set(
+                    node.label, value, attr=dict(node.attr), parent_bag=target, do_trigger=False
+                )
         return result
 
     # -------------------- pickle support --------------------------------
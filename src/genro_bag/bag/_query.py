@@ -20,6 +20,7 @@ Methods provided:
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, overload
 
 from genro_toolbox import safe_is_instance
@@ -30,6 +31,25 @@ if TYPE_CHECKING:
 _IS_BAG = "genro_bag.bag._core.Bag"
 
 
+@lru_cache(maxsize=128)
+def _parse_query_what(what: str) -> tuple[str | None, tuple[str, ...]]:
+    """Split a query() what string into its optional subpath and column specs.
+
+    Cached on the string alone: the same spec (e.g. '#k,#v') is usually
+    queried many times, so it is parsed once.
+
+    Args:
+        what: Spec like '#k,#v' or 'subpath:#k,#v'.
+
+    Returns:
+        Tuple of (where, whatsplit): where is the subpath or None.
+    """
+    where = None
+    if ":" in what:
+        where, what = what.split(":")
+    return where, tuple(x.strip() for x in what.split(","))
+
+
 class BagQuery:
     """Mixin providing query, iteration and aggregation methods for Bag.
 
@@ -247,15 +267,23 @@ class BagQuery:
             return None
 
         # Generator mode - uses static parameter (default True)
-        def _walk_gen(bag: Any, prefix: str) -> Iterator[tuple[str, BagNode]]:
-            for node in bag._nodes:
+        def _walk_gen() -> Iterator[tuple[str, BagNode]]:
+            # Explicit stack of (prefix, node iterator): one generator frame
+            # regardless of depth, instead of a yield-from chain per level.
+            stack: list[tuple[str, Iterator[BagNode]]] = [("", iter(self._nodes))]
+            while stack:
+                prefix, nodes = stack[-1]
+                node = next(nodes, None)
+                if node is None:
+                    stack.pop()
+                    continue
                 path = f"{prefix}.{node.label}" if prefix else node.label
                 yield path, node
                 value = node.get_value(static=static)
                 if safe_is_instance(value, _IS_BAG):
-                    yield from _walk_gen(value, path)
+                    stack.append((path, iter(value._nodes)))
 
-        return _walk_gen(self, "")
+        return _walk_gen()
 
     def query(
         self,
@@ -318,14 +346,10 @@ class BagQuery:
         if not what:
             what = "#k,#v,#a"
         if isinstance(what, str):
-            if ":" in what:
-                where, what = what.split(":")
-                obj = self[where]
-            else:
-                obj = self
-            whatsplit = [x.strip() for x in what.split(",")]
+            where, whatsplit = _parse_query_what(what)
+            obj = self if where is None else self[where]
         else:
-            whatsplit = what
+            whatsplit = tuple(what)
             obj = self
 
         def _extract_value(node: BagNode, w: str, path: str,
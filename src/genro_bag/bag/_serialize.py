@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import json
 import re
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 from xml.dom.minidom import parseString
 from xml.sax import saxutils
@@ -22,6 +23,48 @@ if TYPE_CHECKING:
 
 # Regex for sanitizing XML tag names
 _INVALID_XML_TAG_CHARS = re.compile(r"[^\w.]", re.ASCII)
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+
+def _xml_escape(text: str) -> str:
+    """Escape XML text content, skipping saxutils when nothing needs escaping."""
+    if "&" in text or "<" in text or ">" in text:
+        return saxutils.escape(text)
+    return text
+
+
+def _xml_quoteattr(value: str) -> str:
+    """Quote an XML attribute value, skipping saxutils for plain values.
+
+    Output is identical to saxutils.quoteattr; most attribute values carry
+    none of the characters it rewrites, so they are just wrapped in quotes.
+    """
+    if (
+        "&" in value or "<" in value or ">" in value or '"' in value
+        or "\n" in value or "\r" in value or "\t" in value
+    ):
+        return saxutils.quoteattr(value)
+    return f'"{value}"'
+
+
+@lru_cache(maxsize=8192)
+def _sanitize_tag_name(tag: str) -> tuple[str, str | None]:
+    """Sanitize a non-empty, non-namespaced tag name (cached per label).
+
+    Labels repeat heavily across a Bag (record-like structures), so the
+    regex work is done once per distinct label.
+
+    Returns:
+        (sanitized_tag, original_tag_or_none)
+    """
+    sanitized = _REPEATED_UNDERSCORES.sub("_", _INVALID_XML_TAG_CHARS.sub("_", tag))
+
+    if sanitized[0].isdigit():
+        sanitized = "_" + sanitized
+
+    if sanitized != tag:
+        return sanitized, tag
+    return sanitized, None
 
 
 class BagSerializer:
@@ -67,7 +110,9 @@ class BagSerializer:
             >>> bag.to_xml()
             '<name>test</name><count>42</count>'
         """
-        content = self._bag_to_xml(namespaces=[], self_closed_tags=self_closed_tags)
+        # Membership is tested once per empty element: use a set
+        self_closed = None if self_closed_tags is None else frozenset(self_closed_tags)
+        content = self._bag_to_xml(namespaces=[], self_closed_tags=self_closed)
 
         # Pretty print (before adding header)
         if pretty:
@@ -104,20 +149,20 @@ class BagSerializer:
             end = pretty_xml.rfind("</_root_>")
             return pretty_xml[start:end].strip()
 
-    def _bag_to_xml(self, namespaces: list[str], self_closed_tags: list[str] | None = None) -> str:
+    def _bag_to_xml(
+        self, namespaces: list[str], self_closed_tags: Collection[str] | None = None
+    ) -> str:
         """Convert Bag to XML string."""
-        parts = []
-        for node in self:
-            parts.append(self._node_to_xml(node, namespaces, self_closed_tags))
-        return "".join(parts)
+        return "".join([self._node_to_xml(node, namespaces, self_closed_tags) for node in self])
 
     def _node_to_xml(
-        self, node: Any, namespaces: list[str], self_closed_tags: list[str] | None = None
+        self, node: Any, namespaces: list[str], self_closed_tags: Collection[str] | None = None
     ) -> str:
         """Convert a BagNode to XML string."""
         # Extract local namespaces from this node's attributes
-        local_namespaces = self._extract_namespaces(node.attr)
-        current_namespaces = namespaces + local_namespaces
+        attr = node.attr
+        local_namespaces = self._extract_namespaces(attr)
+        current_namespaces = namespaces + local_namespaces if local_namespaces else namespaces
 
         # Use xml_tag (from parsing), or node_tag (semantic type), or label (unique key)
         xml_tag = node.xml_tag or node.node_tag or node.label
@@ -126,12 +171,12 @@ class BagSerializer:
         # Build attributes string
         attrs_parts = []
         if original_tag is not None:
-            attrs_parts.append(f"_tag={saxutils.quoteattr(original_tag)}")
+            attrs_parts.append(f"_tag={_xml_quoteattr(original_tag)}")
 
-        if node.attr:
-            for k, v in node.attr.items():
-                if v is not None:
-                    attrs_parts.append(f"{k}={saxutils.quoteattr(str(v))}")
+        if attr:
+            attrs_parts.extend(
+                [f"{k}={_xml_quoteattr(str(v))}" for k, v in attr.items() if v is not None]
+            )
 
         attrs_str = " " + " ".join(attrs_parts) if attrs_parts else ""
 
@@ -154,7 +199,7 @@ class BagSerializer:
                 return f"<{tag}{attrs_str}/>"
             return f"<{tag}{attrs_str}></{tag}>"
 
-        text = saxutils.escape(str(value))
+        text = _xml_escape(str(value))
         return f"<{tag}{attrs_str}>{text}</{tag}>"
 
     @staticmethod
@@ -178,14 +223,7 @@ class BagSerializer:
             if prefix in namespaces:
                 return tag, None
 
-        sanitized = re.sub(r"_+", "_", _INVALID_XML_TAG_CHARS.sub("_", tag))
-
-        if sanitized[0].isdigit():
-            sanitized = "_" + sanitized
-
-        if sanitized != tag:
-            return sanitized, tag
-        return sanitized, None
+        return _sanitize_tag_name(tag)
 
     @staticmethod
     def _extract_namespaces(attrs: dict | None) -> list[str]:
@@ -9,6 +9,7 @@ contexts transparently.
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from genro_toolbox import is_async_context, smartawait, smartcontinuation
@@ -20,6 +21,26 @@ if TYPE_CHECKING:
     from genro_bag.bagnode import BagNode
 
 
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted path string into its segments.
+
+    Applies the '../' alias and keeps '\\.' escapes inside labels. Cached on
+    the raw string, since the same paths are traversed over and over.
+
+    Args:
+        path: Dot-separated path like 'a.b.c' or '../x'.
+
+    Returns:
+        Tuple of non-empty, stripped path segments.
+    """
+    path = path.replace("../", "#parent.")
+    if "\\." in path:
+        path = path.replace("\\.", chr(1))
+        return tuple(x.strip().replace(chr(1), "\\.") for x in path.split(".") if x.strip())
+    return tuple(x.strip() for x in path.split(".") if x.strip())
+
+
 class BagTraverse:
     """Mixin providing hierarchical path traversal for Bag.
 
@@ -37,7 +58,8 @@ class BagTraverse:
         and processes any leading #parent segments.
 
         Args:
-            path: Dot-separated path like 'a.b.c' or list ['a', 'b', 'c'].
+            path: Dot-separated path like 'a.b.c', or a pre-split sequence of
+                segments like ['a', 'b', 'c'] or ('a', 'b', 'c').
 
         Returns:
             Tuple of (curr, pathlist) where:
@@ -46,15 +68,7 @@ class BagTraverse:
         """
         curr: Bag | None = self  # type: ignore[assignment]
 
-        if isinstance(path, str):
-            path = path.replace("../", "#parent.")
-            if "\\." in path:
-                path = path.replace("\\.", chr(1))
-                pathlist = [x.strip().replace(chr(1), "\\.") for x in path.split(".") if x.strip()]
-            else:
-                pathlist = [x.strip() for x in path.split(".") if x.strip()]
-        else:
-            pathlist = list(path)
+        pathlist = list(_split_path(path)) if isinstance(path, str) else list(path)
 
         # handle parent reference #parent at the beginning
         while pathlist and pathlist[0] == "#parent" and curr is not None:
@@ -620,8 +620,9 @@ class BagResolver:
                 self._kw.update(call_kwargs)
                 self._cache_last_update = None
 
-        # Without call_kwargs: use cache if valid
-        if not self.read_only and not self.expired:
+        # Without call_kwargs: use cache if valid (expired first: it is
+        # always True for cache_time=0, the default, so read_only is skipped)
+        if not self.expired and not self.read_only:
             return self.cached_value
 
         # Cache expired or read_only: reload
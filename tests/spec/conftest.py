@@ -4,6 +4,8 @@
 import pytest
 from genro_toolbox import reset_smartasync_cache
 
+from genro_bag import Bag
+
 
 @pytest.fixture(autouse=True)
 def reset_smartasync_caches():
@@ -14,3 +16,57 @@ def reset_smartasync_caches():
     """
     reset_smartasync_cache()
     yield
+
+
+@pytest.fixture
+def bag():
+    """Fresh empty Bag.
+
+    A new instance per test rather than a shared one cleared in between:
+    clear() drops nodes but not subscribers, backref or root attributes,
+    so reusing an instance would leak state across tests.
+    """
+    return Bag()
+
+
+@pytest.fixture(scope="session")
+def abc_bag_template():
+    """Prebuilt ``{'a': 1, 'b': 2, 'c': 3}`` Bag shared by the whole session.
+
+    Read-only: tests must never receive it directly, use ``abc_bag``.
+    """
+    return Bag({"a": 1, "b": 2, "c": 3})
+
+
+@pytest.fixture
+def abc_bag(abc_bag_template):
+    """Fresh ``{'a': 1, 'b': 2, 'c': 3}`` Bag, deep-copied from the template."""
+    return abc_bag_template.deepcopy()
+
+
+@pytest.fixture(scope="session")
+def abcd_bag_template():
+    """Prebuilt ``{'a': 1, 'b': 2, 'c': 3, 'd': 4}`` Bag shared by the session.
+
+    Read-only: tests must never receive it directly, use ``abcd_bag``.
+    """
+    return Bag({"a": 1, "b": 2, "c": 3, "d": 4})
+
+
+@pytest.fixture
+def abcd_bag(abcd_bag_template):
+    """Fresh ``{'a': 1, 'b': 2, 'c': 3, 'd': 4}`` Bag, deep-copied from the template."""
+    return abcd_bag_template.deepcopy()
+
+
+@pytest.fixture
+def people():
+    """Fresh ``alice``/``bob`` record Bags, used as node values.
+
+    Built per test: a Bag stored as a value gets its parent set on it,
+    so sharing one instance across tests would leak that state.
+    """
+    return (
+        Bag({"name": "alice", "age": 30}),
+        Bag({"name": "bob", "age": 25}),
+    )
@@ -37,6 +37,9 @@ import pytest
 
 from genro_bag import Bag, BagException, BagNode, BagNodeException
 
+# path 'a.b.c' gia' spezzato: evita lo split della stringa a ogni accesso
+PATH_ABC = ("a", "b", "c")
+
 
 # =============================================================================
 # 1. Costruzione vuota
@@ -142,104 +145,89 @@ class TestBracketGet:
 
 
 class TestSetItem:
-    def test_simple_label(self):
+    def test_simple_label(self, bag):
         """bag['a'] = 1; get_item('a') == 1."""
-        bag = Bag()
         bag["a"] = 1
         assert bag.get_item("a") == 1
 
-    def test_set_item_method_equivalent_to_bracket(self):
+    def test_set_item_method_equivalent_to_bracket(self, bag):
         """set_item('a', 1) equivale a bag['a'] = 1."""
-        bag = Bag()
         bag.set_item("a", 1)
         assert bag.get_item("a") == 1
 
-    def test_dotted_path(self):
+    def test_dotted_path(self, bag):
         """set_item('a.b.c', 42); get_item duale sullo stesso path."""
-        bag = Bag()
         bag.set_item("a.b.c", 42)
         assert bag.get_item("a.b.c") == 42
 
-    def test_overwrite_value(self):
+    def test_overwrite_value(self, bag):
         """Assegnare due volte aggiorna il valore."""
-        bag = Bag()
         bag["x"] = 1
         bag["x"] = 2
         assert bag.get_item("x") == 2
 
-    def test_attributes_via_underscore_param(self):
+    def test_attributes_via_underscore_param(self, bag):
         """_attributes={...} impostati sul nodo, leggibili via get_attr."""
-        bag = Bag()
         bag.set_item("a.b", "hello", _attributes={"type": "greeting", "lang": "it"})
         assert bag.get_attr("a.b", "type") == "greeting"
         assert bag.get_attr("a.b", "lang") == "it"
 
-    def test_kwargs_merged_into_attributes(self):
+    def test_kwargs_merged_into_attributes(self, bag):
         """kwargs extra diventano attributi del nodo."""
-        bag = Bag()
         bag.set_item("x", 1, type="int", size=4)
         assert bag.get_attr("x", "type") == "int"
         assert bag.get_attr("x", "size") == 4
 
-    def test_kwargs_override_explicit_attributes(self):
+    def test_kwargs_override_explicit_attributes(self, bag):
         """kwargs vincono su _attributes."""
-        bag = Bag()
         bag.set_item("x", 1, _attributes={"type": "old"}, type="new")
         assert bag.get_attr("x", "type") == "new"
 
-    def test_query_syntax_sets_single_attribute(self):
+    def test_query_syntax_sets_single_attribute(self, bag):
         """set_item('x?attr', v) scrive solo l'attributo, il valore rimane."""
-        bag = Bag()
         bag["x"] = 10
         bag.set_item("x?myattr", "attr_value")
         assert bag.get_attr("x", "myattr") == "attr_value"
         assert bag.get_item("x") == 10
 
-    def test_query_syntax_sets_multiple_attributes(self):
+    def test_query_syntax_sets_multiple_attributes(self, bag):
         """set_item('x?a&b&c', (1,2,3)) imposta piu' attributi."""
-        bag = Bag()
         bag["x"] = 0
         bag.set_item("x?a&b&c", (1, 2, 3))
         assert bag.get_attr("x", "a") == 1
         assert bag.get_attr("x", "b") == 2
         assert bag.get_attr("x", "c") == 3
 
-    def test_fired_resets_value_to_none(self):
+    def test_fired_resets_value_to_none(self, bag):
         """set_item(v, _fired=True): dopo la set, get_item e' None."""
-        bag = Bag()
         bag.set_item("event", "click", _fired=True)
         assert bag.get_item("event") is None
 
-    def test_returns_bagnode_instance(self):
+    def test_returns_bagnode_instance(self, bag):
         """set_item ritorna un BagNode (solo tipo verificato qui)."""
-        bag = Bag()
         result = bag.set_item("a", 42)
         assert isinstance(result, BagNode)
 
-    def test_returned_node_exposes_label_via_public_api(self):
+    def test_returned_node_exposes_label_via_public_api(self, bag):
         """Il BagNode restituito ha label pari al path finale."""
-        bag = Bag()
         node = bag.set_item("a.b.c", 42)
         assert isinstance(node, BagNode)
         assert node.label == "c"
 
-    def test_returned_node_exposes_value_via_public_api(self):
+    def test_returned_node_exposes_value_via_public_api(self, bag):
         """Il BagNode restituito ha value pari al valore assegnato."""
-        bag = Bag()
         node = bag.set_item("a", 42)
         assert isinstance(node, BagNode)
         assert node.value == 42
 
-    def test_returned_node_exposes_attr_via_public_api(self):
+    def test_returned_node_exposes_attr_via_public_api(self, bag):
         """Il BagNode restituito ha attr pari al dict passato."""
-        bag = Bag()
         node = bag.set_item("a", 1, _attributes={"k": "v"})
         assert isinstance(node, BagNode)
         assert node.attr == {"k": "v"}
 
-    def test_returned_node_exposes_node_tag_via_public_api(self):
+    def test_returned_node_exposes_node_tag_via_public_api(self, bag):
         """node_tag finisce come proprieta' pubblica del nodo."""
-        bag = Bag()
         node = bag.set_item("doc", "hello", node_tag="paragraph")
         assert isinstance(node, BagNode)
         assert node.node_tag == "paragraph"
@@ -251,21 +239,18 @@ class TestSetItem:
 
 
 class TestGetNode:
-    def test_get_node_returns_bagnode_instance(self):
+    def test_get_node_returns_bagnode_instance(self, bag):
         """get_node('a') ritorna un BagNode se il path esiste."""
-        bag = Bag()
         bag["a"] = 42
         result = bag.get_node("a")
         assert isinstance(result, BagNode)
 
-    def test_get_node_missing_returns_none(self):
+    def test_get_node_missing_returns_none(self, bag):
         """get_node su path inesistente ritorna None."""
-        bag = Bag()
         assert bag.get_node("missing") is None
 
-    def test_get_node_exposes_value_attr_label(self):
+    def test_get_node_exposes_value_attr_label(self, bag):
         """Le proprieta' pubbliche del nodo restituito sono coerenti."""
-        bag = Bag()
         bag.set_item("a", 42, _attributes={"type": "int"})
         node = bag.get_node("a")
         assert isinstance(node, BagNode)
@@ -273,28 +258,25 @@ class TestGetNode:
         assert node.value == 42
         assert node.attr == {"type": "int"}
 
-    def test_get_node_autocreate_creates_missing(self):
+    def test_get_node_autocreate_creates_missing(self, bag):
         """autocreate=True crea il nodo se mancante."""
-        bag = Bag()
         node = bag.get_node("new", autocreate=True)
         assert isinstance(node, BagNode)
         assert node.label == "new"
         # leggibile via get_item
         assert bag.get_item("new") is None
 
-    def test_get_node_none_path_returns_parent_node(self):
+    def test_get_node_none_path_returns_parent_node(self, bag):
         """get_node(None) su root ritorna None (no parent)."""
-        bag = Bag()
         assert bag.get_node(None) is None
 
-    def test_get_node_as_tuple_returns_container_and_node(self):
+    def test_get_node_as_tuple_returns_container_and_node(self, bag):
         """as_tuple=True ritorna (Bag, BagNode)."""
-        bag = Bag()
         bag["a.b"] = 1
         result = bag.get_node("a.b", as_tuple=True)
         assert isinstance(result, tuple)
         container, node = result
-        assert isinstance(container, Bag)
+        assert type(container) is Bag
         assert isinstance(node, BagNode)
         assert node.label == "b"
         assert node.value == 1
@@ -314,9 +296,8 @@ class TestGetNode:
         assert isinstance(n, BagNode)
         assert n.label == "a"
 
-    def test_set_item_return_matches_get_node(self):
+    def test_set_item_return_matches_get_node(self, bag):
         """set_item('a', v) e get_node('a') restituiscono lo stesso nodo."""
-        bag = Bag()
         set_ret = bag.set_item("a", 42)
         got = bag.get_node("a")
         assert set_ret is got
@@ -332,9 +313,8 @@ class TestDunderProtocols:
         """len(Bag()) == 0."""
         assert len(Bag()) == 0
 
-    def test_len_counts_first_level_children(self):
+    def test_len_counts_first_level_children(self, bag):
         """len conta solo i figli diretti; path puntati contano il primo livello."""
-        bag = Bag()
         bag["a"] = 1
         bag["b.c"] = 2
         assert len(bag) == 2
@@ -343,22 +323,19 @@ class TestDunderProtocols:
         """Bag({...}) ha len pari al numero di chiavi del dict."""
         assert len(Bag({"a": 1, "b": 2, "c": 3})) == 3
 
-    def test_overwrite_does_not_increase_len(self):
+    def test_overwrite_does_not_increase_len(self, bag):
         """Sovrascrivere un path esistente non cambia len."""
-        bag = Bag()
         bag["x"] = 1
         bag["x"] = 2
         assert len(bag) == 1
 
-    def test_contains_existing_path(self):
+    def test_contains_existing_path(self, bag):
         """'a.b' in bag e' True dopo set_item('a.b')."""
-        bag = Bag()
         bag["a.b"] = 1
         assert "a.b" in bag
 
-    def test_contains_missing_path(self):
+    def test_contains_missing_path(self, bag):
         """path mai settato -> not in bag."""
-        bag = Bag()
         bag["a.b"] = 1
         assert "a.c" not in bag
 
@@ -383,9 +360,8 @@ class TestDunderProtocols:
         bag = Bag({"a": 1, "b": 2})
         assert bag() == ["a", "b"]
 
-    def test_call_with_path_returns_value(self):
+    def test_call_with_path_returns_value(self, bag):
         """bag(path) equivale a bag[path]."""
-        bag = Bag()
         bag["a.b"] = 42
         assert bag("a.b") == 42
 
@@ -396,9 +372,8 @@ class TestDunderProtocols:
 
 
 class TestSetItemOrdering:
-    def test_sequential_set_appends(self):
+    def test_sequential_set_appends(self, bag):
         """set_item successivi aggiungono in coda (default)."""
-        bag = Bag()
         bag["a"] = 1
         bag["b"] = 2
         bag["c"] = 3
@@ -406,25 +381,19 @@ class TestSetItemOrdering:
 
     def test_node_position_lt_prepends(self):
         """node_position='<' mette in testa."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
+        bag = Bag({"a": 1, "b": 2})
         bag.set_item("c", 3, node_position="<")
         assert [n.label for n in bag] == ["c", "a", "b"]
 
     def test_node_position_before_label(self):
         """node_position='<b' inserisce prima del label 'b'."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
+        bag = Bag({"a": 1, "b": 2})
         bag.set_item("x", 99, node_position="<b")
         assert [n.label for n in bag] == ["a", "x", "b"]
 
     def test_node_position_after_label(self):
         """node_position='>a' inserisce dopo il label 'a'."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
+        bag = Bag({"a": 1, "b": 2})
         bag.set_item("x", 99, node_position=">a")
         assert [n.label for n in bag] == ["a", "x", "b"]
 
@@ -435,28 +404,24 @@ class TestSetItemOrdering:
 
 
 class TestPop:
-    def test_pop_removes_and_returns_value(self):
+    def test_pop_removes_and_returns_value(self, bag):
         """pop('a.b') rimuove il nodo e ne restituisce il valore."""
-        bag = Bag()
         bag["a.b"] = 42
         assert bag.pop("a.b") == 42
         assert "a.b" not in bag
 
-    def test_pop_missing_returns_default(self):
+    def test_pop_missing_returns_default(self, bag):
         """pop su path inesistente restituisce default."""
-        bag = Bag()
         assert bag.pop("missing", "gone") == "gone"
 
-    def test_del_item_is_alias_for_pop(self):
+    def test_del_item_is_alias_for_pop(self, bag):
         """del bag[path] rimuove il nodo."""
-        bag = Bag()
         bag["a"] = 1
         del bag["a"]
         assert "a" not in bag
 
-    def test_pop_node_returns_bagnode_instance(self):
+    def test_pop_node_returns_bagnode_instance(self, bag):
         """pop_node restituisce un BagNode."""
-        bag = Bag()
         bag.set_item("a", 42, _attributes={"type": "int"})
         node = bag.pop_node("a")
         assert isinstance(node, BagNode)
@@ -464,9 +429,8 @@ class TestPop:
         assert node.value == 42
         assert node.attr == {"type": "int"}
 
-    def test_pop_node_missing_returns_none(self):
+    def test_pop_node_missing_returns_none(self, bag):
         """pop_node su path inesistente restituisce None."""
-        bag = Bag()
         assert bag.pop_node("missing") is None
 
 
@@ -482,9 +446,8 @@ class TestClear:
         bag.clear()
         assert len(bag) == 0
 
-    def test_clear_on_empty_is_noop(self):
+    def test_clear_on_empty_is_noop(self, bag):
         """clear() su Bag vuoto non solleva."""
-        bag = Bag()
         bag.clear()
         assert len(bag) == 0
 
@@ -500,14 +463,14 @@ class TestClear:
         received = []
         root.subscribe("watch", update=lambda **kw: received.append(kw))
         inner = root.get_item("inner")
-        assert isinstance(inner, Bag)
+        assert type(inner) is Bag
         inner.clear()
         # il parent ha ricevuto upd_value per il nodo 'inner'
         assert any(kw.get("evt") == "upd_value" for kw in received)
         # oldvalue e' un Bag orfano con i nodi rimossi
         upd = next(kw for kw in received if kw.get("evt") == "upd_value")
         oldvalue = upd.get("oldvalue")
-        assert isinstance(oldvalue, Bag)
+        assert type(oldvalue) is Bag
         assert oldvalue.keys() == ["a", "b"]
 
     def test_clear_with_trigger_false_skips_notification(self):
@@ -518,7 +481,7 @@ class TestClear:
         received = []
         root.subscribe("watch", update=lambda **kw: received.append(kw))
         inner = root.get_item("inner")
-        assert isinstance(inner, Bag)
+        assert type(inner) is Bag
         inner.clear(trigger=False)
         # il parent NON ha ricevuto nessun upd_value
         assert not any(kw.get("evt") == "upd_value" for kw in received)
@@ -588,17 +551,15 @@ class TestRootProperties:
         """Un Bag non annidato ha parent_node None."""
         assert Bag().parent_node is None
 
-    def test_root_is_self_for_root_bag(self):
+    def test_root_is_self_for_root_bag(self, bag):
         """Il root di un Bag non annidato e' se stesso."""
-        bag = Bag()
         assert bag.root is bag
 
-    def test_fullpath_none_without_backref(self):
+    def test_fullpath_none_without_backref(self, bag):
         """fullpath e' None senza backref abilitato."""
-        bag = Bag()
         bag["a.b"] = 1
         inner = bag.get_item("a")
-        assert isinstance(inner, Bag)
+        assert type(inner) is Bag
         assert inner.fullpath is None
 
     def test_attributes_empty_for_standalone_bag(self):
@@ -609,9 +570,8 @@ class TestRootProperties:
         """root_attributes default e' None."""
         assert Bag().root_attributes is None
 
-    def test_root_attributes_setter_stores_copy(self):
+    def test_root_attributes_setter_stores_copy(self, bag):
         """root_attributes setter salva il dict."""
-        bag = Bag()
         bag.root_attributes = {"owner": "test"}
         assert bag.root_attributes == {"owner": "test"}
 
@@ -619,6 +579,19 @@ class TestRootProperties:
         """backref default e' False."""
         assert Bag().backref is False
 
+    def test_set_backref_sets_parent_bag_on_nodes(self, abc_bag):
+        """set_backref() aggancia ogni nodo alla Bag che lo contiene."""
+        abc_bag.set_backref()
+        assert abc_bag.backref is True
+        assert all(n.parent_bag is abc_bag for n in abc_bag)
+
+    def test_clear_backref_clears_parent_bag_on_nodes(self, abc_bag):
+        """clear_backref() sgancia tutti i nodi (parent_bag None)."""
+        abc_bag.set_backref()
+        abc_bag.clear_backref()
+        assert abc_bag.backref is False
+        assert all(n.parent_bag is None for n in abc_bag)
+
     def test_get_inherited_attributes_merges_ancestors(self):
         """get_inherited_attributes su un nodo ritorna gli attributi degli ancestor.
 
@@ -628,7 +601,7 @@ class TestRootProperties:
         root = Bag()
         root.set_item("outer", Bag(), _attributes={"role": "admin", "theme": "dark"})
         inner = root.get_item("outer")
-        assert isinstance(inner, Bag)
+        assert type(inner) is Bag
         inner.set_item("leaf", 42, _attributes={"local": "x"})
         root.set_backref()
         leaf = inner.get_node("leaf")
@@ -644,37 +617,32 @@ class TestRootProperties:
 
 
 class TestAttrAccessors:
-    def test_set_attr_on_existing_node(self):
+    def test_set_attr_on_existing_node(self, bag):
         """set_attr aggiunge attributi a un nodo esistente."""
-        bag = Bag()
         bag["a"] = 1
         bag.set_attr("a", type="int")
         assert bag.get_attr("a", "type") == "int"
 
-    def test_get_attr_default_for_missing(self):
+    def test_get_attr_default_for_missing(self, bag):
         """get_attr con default per attributo mancante."""
-        bag = Bag()
         bag["a"] = 1
         assert bag.get_attr("a", "missing", default="x") == "x"
 
-    def test_del_attr_removes(self):
+    def test_del_attr_removes(self, bag):
         """del_attr rimuove l'attributo specifico."""
-        bag = Bag()
         bag.set_item("a", 1, _attributes={"type": "int", "size": 4})
         bag.del_attr("a", "type")
         assert bag.get_attr("a", "type") is None
         assert bag.get_attr("a", "size") == 4
 
-    def test_setdefault_returns_existing(self):
+    def test_setdefault_returns_existing(self, bag):
         """setdefault su path esistente non sovrascrive."""
-        bag = Bag()
         bag["a"] = 1
         assert bag.setdefault("a", 99) == 1
         assert bag.get_item("a") == 1
 
-    def test_setdefault_creates_if_missing(self):
+    def test_setdefault_creates_if_missing(self, bag):
         """setdefault crea il nodo se assente."""
-        bag = Bag()
         assert bag.setdefault("new", 42) == 42
         assert bag.get_item("new") == 42
 
@@ -683,20 +651,18 @@ class TestAttrAccessors:
         bag = Bag({"a": 1, "b": 2})
         assert bag.as_dict() == {"a": 1, "b": 2}
 
-    def test_del_attr_comma_separated_string(self):
+    def test_del_attr_comma_separated_string(self, bag):
         """del_attr accetta una stringa con label separati da virgola.
 
         Uso comune: rimuovere piu' attributi in un colpo solo.
         """
-        bag = Bag()
         bag.set_item("x", 1, _attributes={"a": 1, "b": 2, "c": 3, "d": 4})
         node = bag.get_node("x")
         node.del_attr("a,c")
         assert dict(node.attr) == {"b": 2, "d": 4}
 
-    def test_del_attr_multiple_args(self):
+    def test_del_attr_multiple_args(self, bag):
         """del_attr accetta piu' argomenti separati."""
-        bag = Bag()
         bag.set_item("x", 1, _attributes={"a": 1, "b": 2, "c": 3})
         node = bag.get_node("x")
         node.del_attr("a", "c")
@@ -716,16 +682,14 @@ class TestGetValueQueryString:
         - 'a&b&c' → tupla con valori multipli
     """
 
-    def test_query_string_single_attribute(self):
+    def test_query_string_single_attribute(self, bag):
         """get_value(_query_string='color') ritorna il valore dell'attributo."""
-        bag = Bag()
         bag.set_item("item", "body", _attributes={"color": "red", "size": 42})
         node = bag.get_node("item")
         assert node.get_value(_query_string="color") == "red"
 
-    def test_query_string_multiple_attributes_returns_tuple(self):
+    def test_query_string_multiple_attributes_returns_tuple(self, bag):
         """get_value(_query_string='a&b&c') ritorna una tupla con i valori nell'ordine richiesto."""
-        bag = Bag()
         bag.set_item(
             "item", "body",
             _attributes={"color": "red", "size": 42, "active": True}
@@ -734,9 +698,8 @@ class TestGetValueQueryString:
         result = node.get_value(_query_string="color&size&active")
         assert result == ("red", 42, True)
 
-    def test_query_string_missing_attribute_returns_none(self):
+    def test_query_string_missing_attribute_returns_none(self, bag):
         """Attributo non presente ritorna None (singolo) / None in tupla."""
-        bag = Bag()
         bag.set_item("item", "body", _attributes={"color": "red"})
         node = bag.get_node("item")
         assert node.get_value(_query_string="missing") is None
@@ -752,9 +715,8 @@ class TestLookupByAttributeAndValue:
     su collezioni ordinate (liste di record con id logico, tag, tipo).
     """
 
-    def test_get_node_by_attr_finds_first_match(self):
+    def test_get_node_by_attr_finds_first_match(self, bag):
         """get_node_by_attr(key, value) ritorna il primo nodo con quell'attributo."""
-        bag = Bag()
         bag.set_item("r1", "alice", _attributes={"id": "x", "role": "admin"})
         bag.set_item("r2", "bob", _attributes={"id": "y", "role": "user"})
         bag.set_item("r3", "carol", _attributes={"id": "z", "role": "user"})
@@ -762,54 +724,48 @@ class TestLookupByAttributeAndValue:
         assert node is not None
         assert node.value == "bob"
 
-    def test_get_node_by_attr_non_id_attribute(self):
+    def test_get_node_by_attr_non_id_attribute(self, bag):
         """get_node_by_attr funziona su qualsiasi attributo, non solo 'id'."""
-        bag = Bag()
         bag.set_item("r1", "alice", _attributes={"role": "admin"})
         bag.set_item("r2", "bob", _attributes={"role": "user"})
         node = bag.get_node_by_attr("role", "admin")
         assert node is not None
         assert node.value == "alice"
 
-    def test_get_node_by_attr_returns_none_when_missing(self):
+    def test_get_node_by_attr_returns_none_when_missing(self, bag):
         """get_node_by_attr ritorna None se nessun nodo ha quell'attributo/valore."""
-        bag = Bag()
         bag.set_item("r1", "alice", _attributes={"id": "x"})
         assert bag.get_node_by_attr("id", "missing") is None
 
-    def test_get_node_by_value_finds_dict_match(self):
+    def test_get_node_by_value_finds_dict_match(self, bag, people):
         """get_node_by_value cerca nei valori dict/Bag un match key=value."""
-        bag = Bag()
-        bag.set_item("r1", Bag({"name": "alice", "age": 30}))
-        bag.set_item("r2", Bag({"name": "bob", "age": 25}))
+        alice, bob = people
+        bag.set_item("r1", alice)
+        bag.set_item("r2", bob)
         node = bag.get_node_by_value("name", "bob")
         assert node is not None
         assert node.value["name"] == "bob"
 
-    def test_get_node_by_value_returns_none_when_missing(self):
+    def test_get_node_by_value_returns_none_when_missing(self, bag):
         """get_node_by_value ritorna None se nessun nodo-dict soddisfa la condizione."""
-        bag = Bag()
         bag.set_item("r1", Bag({"name": "alice"}))
         assert bag.get_node_by_value("name", "nobody") is None
 
-    def test_get_node_sharp_equal_value_shortcut(self):
+    def test_get_node_sharp_equal_value_shortcut(self, bag):
         """bag.get_node('#=value') ritorna il primo nodo il cui value == value."""
-        bag = Bag()
         bag.set_item("r1", "alice")
         bag.set_item("r2", "bob")
         node = bag.get_node("#=alice")
         assert node is not None
         assert node.label == "r1"
 
-    def test_get_node_sharp_equal_value_missing_returns_none(self):
+    def test_get_node_sharp_equal_value_missing_returns_none(self, bag):
         """bag.get_node('#=missing') ritorna None se nessun match."""
-        bag = Bag()
         bag.set_item("r1", "alice")
         assert bag.get_node("#=nobody") is None
 
-    def test_get_node_sharp_attr_equal_shortcut(self):
+    def test_get_node_sharp_attr_equal_shortcut(self, bag):
         """bag.get_node('#attr=value') ritorna il nodo con quell'attributo."""
-        bag = Bag()
         bag.set_item("r1", "alice", _attributes={"id": "X"})
         bag.set_item("r2", "bob", _attributes={"id": "Y"})
         node = bag.get_node("#id=Y")
@@ -828,9 +784,8 @@ class TestSetValueWithSpecialObjects:
     - oggetti con attributo 'rootattributes' dict (merge attrs)
     """
 
-    def test_set_item_with_bagnode_extracts_value_and_attrs(self):
+    def test_set_item_with_bagnode_extracts_value_and_attrs(self, bag):
         """Passando un BagNode come value, il target eredita value + attributi."""
-        bag = Bag()
         bag.set_item("src", "hello", _attributes={"type": "greeting", "lang": "en"})
         src_node = bag.get_node("src")
         assert src_node is not None
@@ -871,16 +826,14 @@ class TestSetValueWithSpecialObjects:
 
 
 class TestSetItemResolverGuard:
-    def test_raises_when_overwriting_resolver_without_param(self):
+    def test_raises_when_overwriting_resolver_without_param(self, bag):
         """Sovrascrivere un nodo con resolver senza resolver= solleva BagNodeException."""
-        bag = Bag()
         bag.set_callback_item("data", lambda: "computed")
         with pytest.raises(BagNodeException):
             bag.set_item("data", "new")
 
-    def test_resolver_false_removes_resolver(self):
+    def test_resolver_false_removes_resolver(self, bag):
         """resolver=False rimuove il resolver e scrive il nuovo valore."""
-        bag = Bag()
         bag.set_callback_item("data", lambda: "computed")
         bag.set_item("data", "new", resolver=False)
         # il nodo non ha piu' resolver e il valore nuovo e' letto
@@ -905,24 +858,21 @@ class TestSetItemResolverGuard:
 class TestSetItemAttrSyntax:
     """La sintassi 'path?a&b&c' richiede un tuple di valori con lunghezza coerente."""
 
-    def test_single_attr_syntax_sets_attribute(self):
+    def test_single_attr_syntax_sets_attribute(self, bag):
         """set_item('path?attr', value) scrive un attributo singolo."""
-        bag = Bag()
         bag.set_item("x", 1)
         bag.set_item("x?color", "red")
         assert bag.get_attr("x", "color") == "red"
 
-    def test_multi_attr_syntax_with_tuple(self):
+    def test_multi_attr_syntax_with_tuple(self, bag):
         """set_item('path?a&b', (v1, v2)) distribuisce i valori sugli attributi."""
-        bag = Bag()
         bag.set_item("x", 1)
         bag.set_item("x?a&b", (10, 20))
         assert bag.get_attr("x", "a") == 10
         assert bag.get_attr("x", "b") == 20
 
-    def test_multi_attr_syntax_tuple_length_mismatch_raises(self):
+    def test_multi_attr_syntax_tuple_length_mismatch_raises(self, bag):
         """set_item('path?a&b', tuple di lunghezza diversa) solleva BagNodeException."""
-        bag = Bag()
         bag.set_item("x", 1)
         with pytest.raises(BagNodeException):
             bag.set_item("x?a&b", (10, 20, 30))
@@ -938,17 +888,15 @@ class TestSetItemNodeTag:
     su un nodo gia' esistente senza ricrearlo.
     """
 
-    def test_set_item_assigns_node_tag_on_create(self):
+    def test_set_item_assigns_node_tag_on_create(self, bag):
         """Alla creazione, set_item(node_tag='X') imposta il tag."""
-        bag = Bag()
         bag.set_item("x", 42, node_tag="special")
         node = bag.get_node("x")
         assert node is not None
         assert node.node_tag == "special"
 
-    def test_set_item_updates_node_tag_on_existing(self):
+    def test_set_item_updates_node_tag_on_existing(self, bag):
         """Su nodo esistente, set_item(node_tag='new') aggiorna il tag."""
-        bag = Bag()
         bag.set_item("x", 42, node_tag="initial")
         bag.set_item("x", 99, node_tag="updated")
         node = bag.get_node("x")
@@ -967,9 +915,8 @@ class TestGetValueKwargsSyntax:
     dict-like 'k=v' prova a passare kwargs al resolver. Senza resolver solleva.
     """
 
-    def test_kwargs_syntax_without_resolver_raises(self):
+    def test_kwargs_syntax_without_resolver_raises(self, bag):
         """node.get_value(_query_string='k=v') su nodo senza resolver solleva."""
-        bag = Bag()
         bag.set_item("x", "plain")
         node = bag.get_node("x")
         assert node is not None
@@ -988,9 +935,8 @@ class TestSetValueChangeDetection:
     cambio di attributi notifica comunque il parent.
     """
 
-    def test_same_value_with_new_attrs_still_triggers(self):
+    def test_same_value_with_new_attrs_still_triggers(self, bag):
         """Replay con value identico ma attrs diversi produce evento upd."""
-        bag = Bag()
         bag.set_item("x", 42, _attributes={"a": 1})
         received = []
         bag.subscribe("w", update=lambda **kw: received.append(kw.get("evt")))
@@ -1006,31 +952,21 @@ class TestSetValueChangeDetection:
 
 
 class TestMove:
-    def test_move_single_node_forward(self):
+    def test_move_single_node_forward(self, abc_bag):
         """move(0, 2) sposta il primo nodo alla posizione 2."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
-        bag["c"] = 3
+        bag = abc_bag
         bag.move(0, 2)
         assert bag.keys() == ["b", "c", "a"]
 
-    def test_move_single_node_backward(self):
+    def test_move_single_node_backward(self, abc_bag):
         """move(2, 0) sposta l'ultimo nodo in testa."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
-        bag["c"] = 3
+        bag = abc_bag
         bag.move(2, 0)
         assert bag.keys() == ["c", "a", "b"]
 
-    def test_move_list_of_indices(self):
+    def test_move_list_of_indices(self, abcd_bag):
         """move([0, 2], 1) sposta piu' nodi mantenendo l'ordine relativo."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
-        bag["c"] = 3
-        bag["d"] = 4
+        bag = abcd_bag
         bag.move([0, 2], 1)
         # i nodi spostati ('a' e 'c') vengono inseriti attorno alla destinazione
         # la chiave importante: i nodi non spostati conservano ordine relativo
@@ -1039,30 +975,27 @@ class TestMove:
         # 'b' e 'd' (non spostati) mantengono ordine relativo
         assert result.index("b") < result.index("d")
 
-    def test_move_to_same_position_is_noop(self):
+    def test_move_to_same_position_is_noop(self, abc_bag):
         """move(1, 1) non cambia l'ordine."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["b"] = 2
-        bag["c"] = 3
+        bag = abc_bag
         bag.move(1, 1)
         assert bag.keys() == ["a", "b", "c"]
 
-    def test_move_with_negative_position_is_noop(self):
+    def test_move_with_negative_position_is_noop(self, abc_bag):
         """move con position < 0 non altera il Bag."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
+        bag = abc_bag
         bag.move(0, -1)
         assert bag.keys() == ["a", "b", "c"]
 
-    def test_move_with_position_out_of_range_is_noop(self):
+    def test_move_with_position_out_of_range_is_noop(self, abc_bag):
         """move con position >= len non altera il Bag."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
+        bag = abc_bag
         bag.move(0, 99)
         assert bag.keys() == ["a", "b", "c"]
 
-    def test_move_with_empty_indices_list_is_noop(self):
+    def test_move_with_empty_indices_list_is_noop(self, abc_bag):
         """move([], pos) non altera il Bag."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
+        bag = abc_bag
         bag.move([], 0)
         assert bag.keys() == ["a", "b", "c"]
 
@@ -1076,9 +1009,9 @@ class TestMove:
         # 'a' e 'b' mantengono l'ordine relativo
         assert result.index("a") < result.index("b")
 
-    def test_move_single_with_source_out_of_range_is_noop(self):
+    def test_move_single_with_source_out_of_range_is_noop(self, abc_bag):
         """move(99, 0) con indice di partenza fuori range non altera il Bag."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
+        bag = abc_bag
         bag.move(99, 0)
         assert bag.keys() == ["a", "b", "c"]
 
@@ -1089,17 +1022,15 @@ class TestMove:
 
 
 class TestAsDictFlags:
-    def test_as_dict_lower(self):
+    def test_as_dict_lower(self, bag):
         """as_dict(lower=True) restituisce chiavi in minuscolo."""
-        bag = Bag()
         bag["Name"] = "alice"
         bag["AGE"] = 30
         result = bag.as_dict(lower=True)
         assert result == {"name": "alice", "age": 30}
 
-    def test_as_dict_ascii(self):
+    def test_as_dict_ascii(self, bag):
         """as_dict(ascii=True) forza le chiavi a str (passaggio attraverso str())."""
-        bag = Bag()
         bag["a"] = 1
         result = bag.as_dict(ascii=True)
         assert result == {"a": 1}
@@ -1127,15 +1058,13 @@ class TestNodesProperty:
 
 
 class TestContainsNode:
-    def test_node_in_bag_after_insertion(self):
+    def test_node_in_bag_after_insertion(self, bag):
         """Un BagNode ottenuto via set_item e' contenuto nella Bag."""
-        bag = Bag()
         node = bag.set_item("x", 1)
         assert node in bag
 
-    def test_node_not_in_bag_after_pop(self):
+    def test_node_not_in_bag_after_pop(self, bag):
         """Un BagNode estratto con pop_node non e' piu' contenuto."""
-        bag = Bag()
         bag.set_item("x", 1)
         node = bag.pop_node("x")
         assert isinstance(node, BagNode)
@@ -1158,7 +1087,7 @@ class TestPathNavigation:
         root["outer.sibling"] = "neighbor"
         root.subscribe("w", update=lambda **kw: None)  # abilita backref
         inner_bag = root.get_item("outer")
-        assert isinstance(inner_bag, Bag)
+        assert type(inner_bag) is Bag
         # dal contenitore 'outer' navigo a ../outer.inner
         assert inner_bag.get_item("../outer.inner") == "target"
 
@@ -1168,16 +1097,15 @@ class TestPathNavigation:
         root["outer.inner"] = "target"
         root.subscribe("w", update=lambda **kw: None)
         inner_bag = root.get_item("outer")
-        assert isinstance(inner_bag, Bag)
+        assert type(inner_bag) is Bag
         # #parent ritorna il Bag parent
         assert inner_bag.get("#parent") is root
 
-    def test_backslash_escape_for_literal_dot_in_label(self):
+    def test_backslash_escape_for_literal_dot_in_label(self, bag):
         """Un path con '\\.' tratta il punto come parte del label, non separatore.
 
         Scenario: label che contengono un punto (es. email, domini, versioni).
         """
-        bag = Bag()
         # set_item con path 'user\.name' crea UN nodo con label 'user.name',
         # non due nodi annidati
         bag.set_item("user\\.name", "alice")
@@ -1187,17 +1115,25 @@ class TestPathNavigation:
         # come separatore: 'user' seguito da 'name' non esiste
         assert bag.get_item("user.name") is None
 
-    def test_path_as_list_of_segments(self):
+    def test_path_as_list_of_segments(self, bag):
         """set_item/get_item accettano il path anche come lista di segmenti.
 
         Uso: costruire path programmaticamente senza dover fare '.'.join(...).
         """
-        bag = Bag()
         bag.set_item(["a", "b", "c"], 42)
         # stessa gerarchia creata: leggibile con stringa puntata o lista
         assert bag.get_item("a.b.c") == 42
         assert bag.get_item(["a", "b", "c"]) == 42
 
+    def test_path_as_tuple_of_segments(self, bag):
+        """Anche una tupla di segmenti e' un path valido, equivalente a 'a.b.c'.
+
+        Utile per path costanti pre-spezzati (nessuno split a ogni accesso).
+        """
+        bag[PATH_ABC] = "deep"
+        assert bag["a.b.c"] == "deep"
+        assert bag[PATH_ABC] == "deep"
+
     def test_sharp_parent_on_root_returns_none(self):
         """'#parent' su una Bag senza parent ritorna None (non solleva)."""
         root = Bag()
@@ -1223,12 +1159,11 @@ class TestPathNavigation:
         with pytest.raises(BagException):
             bag.set_item("#5.x", 42)
 
-    def test_get_item_descending_into_scalar_returns_none(self):
+    def test_get_item_descending_into_scalar_returns_none(self, bag):
         """Navigare dentro un valore scalare (non-Bag) ritorna None.
 
         Se 'a' è un int, 'a.b' e 'a.b.c' non sono raggiungibili.
         """
-        bag = Bag()
         bag["a"] = 42
         assert bag.get_item("a.b") is None
         assert bag.get_item("a.b.c") is None
@@ -1240,98 +1175,45 @@ class TestPathNavigation:
 
 
 class TestNodePositionSharpSyntax:
-    def test_position_sharp_n_insert_at_index(self):
-        """node_position='#2' inserisce all'indice 2."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
-        bag.set_item("new", 99, node_position="#1")
-        assert bag.keys() == ["a", "new", "b", "c"]
-
-    def test_position_lt_sharp_n_insert_before_index(self):
-        """node_position='<#n' inserisce prima dell'indice n."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
-        bag.set_item("new", 99, node_position="<#1")
-        assert bag.keys() == ["a", "new", "b", "c"]
-
-    def test_position_gt_sharp_n_insert_after_index(self):
-        """node_position='>#n' inserisce dopo l'indice n."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
-        bag.set_item("new", 99, node_position=">#1")
-        assert bag.keys() == ["a", "b", "new", "c"]
-
-    def test_position_int_positive_out_of_range_clamps_to_len(self):
-        """node_position=int oltre len viene clampato a len (append)."""
-        bag = Bag({"a": 1, "b": 2})
-        bag.set_item("new", 99, node_position=999)
-        assert bag.keys()[-1] == "new"
-
-    def test_position_int_negative_one_inserts_before_last(self):
-        """node_position=-1 inserisce prima dell'ultimo (semantica Python)."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
-        bag.set_item("new", 99, node_position=-1)
-        assert bag.keys() == ["a", "b", "new", "c"]
-
-    def test_position_int_negative_two_inserts_before_penultimate(self):
-        """node_position=-2 inserisce prima del penultimo."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
-        bag.set_item("new", 99, node_position=-2)
-        assert bag.keys() == ["a", "new", "b", "c"]
-
-    def test_position_int_negative_len_inserts_at_start(self):
-        """node_position=-len(bag) equivale a prepend (indice 0)."""
-        bag = Bag({"a": 1, "b": 2, "c": 3})
-        bag.set_item("new", 99, node_position=-3)
-        assert bag.keys() == ["new", "a", "b", "c"]
-
-    def test_position_int_negative_out_of_range_clamps_to_zero(self):
-        """node_position=-999 oltre il range negativo viene clampato a 0 (prepend)."""
-        bag = Bag({"a": 1, "b": 2})
-        bag.set_item("new", 99, node_position=-999)
-        assert bag.keys()[0] == "new"
+    @pytest.mark.parametrize(
+        "position,expected",
+        [
+            (None, ["a", "b", "c", "new"]),
+            (">", ["a", "b", "c", "new"]),
+            ("<", ["new", "a", "b", "c"]),
+            ("#1", ["a", "new", "b", "c"]),
+            ("<#1", ["a", "new", "b", "c"]),
+            (">#1", ["a", "b", "new", "c"]),
+            (">#0", ["a", "new", "b", "c"]),
+            ("<c", ["a", "b", "new", "c"]),
+            (">a", ["a", "new", "b", "c"]),
+            (999, ["a", "b", "c", "new"]),
+            (-1, ["a", "b", "new", "c"]),
+            (-2, ["a", "new", "b", "c"]),
+            (-3, ["new", "a", "b", "c"]),
+            (-999, ["new", "a", "b", "c"]),
+        ],
+    )
+    def test_position_inserts_at_expected_index(self, abc_bag, position, expected):
+        """node_position (None, '<', '>', '#n', '<#n', '>#n', '<label', '>label', int)
+        inserisce il nuovo nodo nella posizione attesa; gli int fuori range
+        vengono clampati a [0, len], i negativi contano dalla fine.
+        """
+        abc_bag.set_item("new", 99, node_position=position)
+        assert abc_bag.keys() == expected
 
-    def test_position_int_negative_one_on_empty_bag_clamps_to_zero(self):
+    def test_position_int_negative_one_on_empty_bag_clamps_to_zero(self, bag):
         """node_position=-1 su Bag vuota viene clampato a 0."""
-        bag = Bag()
         bag.set_item("new", 99, node_position=-1)
         assert bag.keys() == ["new"]
 
-    def test_position_sharp_negative_raises_value_error(self):
-        """node_position='#-1' è sintassi malformata: ValueError."""
-        bag = Bag({"a": 1, "b": 2})
-        with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position="#-1")
-
-    def test_position_lt_sharp_negative_raises(self):
-        """node_position='<#-2' è sintassi malformata: ValueError."""
-        bag = Bag({"a": 1, "b": 2})
-        with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position="<#-2")
-
-    def test_position_gt_sharp_negative_raises(self):
-        """node_position='>#-3' è sintassi malformata: ValueError."""
-        bag = Bag({"a": 1, "b": 2})
-        with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position=">#-3")
-
-    def test_position_sharp_non_integer_raises(self):
-        """node_position='#abc' non-intero: ValueError."""
-        bag = Bag({"a": 1, "b": 2})
-        with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position="#abc")
-
-    def test_position_lt_missing_label_raises(self):
-        """node_position='<missing' con label inesistente: ValueError (no silent fallback)."""
-        bag = Bag({"a": 1, "b": 2})
-        with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position="<nonexistent")
-
-    def test_position_gt_missing_label_raises(self):
-        """node_position='>missing' con label inesistente: ValueError."""
-        bag = Bag({"a": 1, "b": 2})
-        with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position=">nonexistent")
-
-    def test_position_unrecognized_string_raises(self):
-        """node_position con sintassi sconosciuta: ValueError."""
-        bag = Bag({"a": 1, "b": 2})
+    @pytest.mark.parametrize(
+        "position",
+        ["#-1", "<#-2", ">#-3", "#abc", "<nonexistent", ">nonexistent", "@foo"],
+    )
+    def test_position_malformed_raises_value_error(self, abc_bag, position):
+        """Sintassi malformata (indice negativo o non intero in '#n', label
+        inesistente, prefisso sconosciuto): ValueError, nessun fallback silenzioso.
+        """
         with pytest.raises(ValueError):
-            bag.set_item("new", 99, node_position="@foo")
+            abc_bag.set_item("new", 99, node_position=position)
@@ -28,6 +28,7 @@ __iter__, __contains__) e da test_query.py (query, keys, values, items).
 from __future__ import annotations
 
 import pickle
+import sys
 from pathlib import Path
 
 import pytest
@@ -82,6 +83,19 @@ class TestFillFromDict:
         # il valore di 'outer' e' una Bag navigabile via path puntato
         assert bag.get_item("outer.inner") == 7
 
+    def test_dotted_and_attr_keys_keep_path_semantics(self):
+        """Le chiavi del dict restano path: 'a.b' crea livelli, 'c?x' un attributo.
+
+        Le label semplici vengono inserite direttamente; le altre passano da
+        set_item con la stessa semantica di bag[key] = value.
+        """
+        bag = Bag()
+        bag.fill_from({"a.b": 1, "c": 2, "c?x": 3})
+        assert bag.get_item("a.b") == 1
+        assert bag.get_item("c") == 2
+        assert bag.get_attr("c", "x") == 3
+        assert [n.label for n in bag] == ["a", "c"]
+
 
 # =============================================================================
 # 3. fill_from(list)
@@ -138,6 +152,19 @@ class TestFillFromBag:
         dst["nest.inner"] = 99
         assert src.get_item("nest.inner") == 42
 
+    def test_attributes_named_like_set_item_params_are_kept(self):
+        """Attributi con nome di parametri di set_item restano attributi."""
+        src = Bag()
+        src.set_item("a", 1)
+        src.set_item("b", 2, _attributes={"node_position": 0, "resolver": "x"})
+        dst = Bag()
+        dst.fill_from(src)
+        # l'ordine della sorgente non cambia
+        assert dst.keys() == ["a", "b"]
+        assert dst.get_attr("b", "node_position") == 0
+        assert dst.get_attr("b", "resolver") == "x"
+        assert dst.get_node("b").resolver is None
+
 
 # =============================================================================
 # 5. fill_from(bytes)
@@ -354,6 +381,22 @@ class TestDeepcopy:
         copy = src.deepcopy()
         assert type(copy) is type(src)
 
+    def test_deepcopy_deep_tree_beyond_recursion_limit(self):
+        """deepcopy di alberi piu' profondi del recursion limit non esplode."""
+        depth = sys.getrecursionlimit() + 100
+        src = Bag()
+        current = src
+        for _ in range(depth):
+            child = Bag()
+            current.set_item("n", child, level=1)
+            current = child
+        current.set_item("leaf", "x")
+        copy = src.deepcopy()
+        path = ".".join(["n"] * depth)
+        assert copy.get_item(f"{path}.leaf") == "x"
+        assert copy.get_item(path) is not src.get_item(path)
+        assert copy.get_attr(path, "level") == 1
+
 
 # =============================================================================
 # 16. update
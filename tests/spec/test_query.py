@@ -24,6 +24,10 @@ get_node, __len__, __iter__, __contains__ siano validi.
 
 from __future__ import annotations
 
+import sys
+
+import pytest
+
 from genro_bag import Bag, BagNode
 
 
@@ -71,7 +75,7 @@ class TestValues:
         bag["a.b"] = 1
         vals = bag.values()
         assert len(vals) == 1
-        assert isinstance(vals[0], Bag)
+        assert type(vals[0]) is Bag
 
 
 # =============================================================================
@@ -136,9 +140,7 @@ class TestIsEmpty:
 
     def test_bag_with_only_none_values_is_empty(self):
         """Nodi con valore None contano come vuoti."""
-        bag = Bag()
-        bag["a"] = None
-        bag["b"] = None
+        bag = Bag({"a": None, "b": None})
         assert bag.is_empty() is True
 
     def test_zero_is_none_treats_zero_as_empty(self):
@@ -270,10 +272,14 @@ class TestWalkGenerator:
     def test_flat_bag_yields_each_node(self):
         """walk() su Bag flat yield una tupla per nodo."""
         bag = Bag({"a": 1, "b": 2})
-        result = list(bag.walk())
-        paths = [p for p, _n in result]
-        assert paths == ["a", "b"]
-        assert all(isinstance(n, BagNode) for _p, n in result)
+        node_a, node_b = bag.get_node("a"), bag.get_node("b")
+        assert isinstance(node_a, BagNode) and isinstance(node_b, BagNode)
+        # consumo lazy: una tupla alla volta, poi il generatore e' esaurito
+        it = bag.walk()
+        assert next(it) == ("a", node_a)
+        assert next(it) == ("b", node_b)
+        with pytest.raises(StopIteration):
+            next(it)
 
     def test_deep_tree_yields_depth_first_paths(self):
         """walk() attraversa depth-first con path puntati."""
@@ -285,6 +291,23 @@ class TestWalkGenerator:
         # depth-first: 'a', 'a.x', 'a.y', 'b'
         assert paths == ["a", "a.x", "a.y", "b"]
 
+    def test_very_deep_tree_does_not_hit_recursion_limit(self):
+        """walk() su una catena piu' profonda del recursion limit non solleva.
+
+        Scenario: albero generato (es. import di XML annidato) con migliaia
+        di livelli; l'attraversamento e' iterativo.
+        """
+        depth = sys.getrecursionlimit() + 100
+        bag = Bag()
+        current = bag
+        for _ in range(depth):
+            child = Bag()
+            current.set_item("n", child)
+            current = child
+        paths = [p for p, _n in bag.walk()]
+        assert len(paths) == depth
+        assert paths[-1] == ".".join(["n"] * depth)
+
 
 # =============================================================================
 # 10. walk() - legacy callback mode
@@ -325,30 +348,32 @@ class TestWalkCallback:
 
 
 class TestQuery:
-    def test_default_what_returns_tuples_k_v_a(self):
-        """query() default = '#k,#v,#a': (label, value, attr)."""
-        bag = Bag()
-        bag.set_item("a", 1, _attributes={"x": 10})
-        bag.set_item("b", 2, _attributes={"x": 20})
-        result = bag.query()
-        assert result == [("a", 1, {"x": 10}), ("b", 2, {"x": 20})]
-
-    def test_query_labels_only(self):
-        """query('#k') ritorna solo le label."""
-        bag = Bag({"a": 1, "b": 2})
-        assert bag.query("#k") == ["a", "b"]
-
-    def test_query_values_only(self):
-        """query('#v') ritorna solo i valori."""
-        bag = Bag({"a": 1, "b": 2})
-        assert bag.query("#v") == [1, 2]
-
-    def test_query_attribute_only(self):
-        """query('#a.type') ritorna il valore dell'attributo 'type' per ogni nodo."""
+    @pytest.mark.parametrize(
+        "what, expected",
+        [
+            # default '#k,#v,#a': (label, value, attr)
+            (None, [("a", 1, {"type": "int"}), ("b", 2, {"type": "str"})]),
+            ("#k", ["a", "b"]),
+            ("#v", [1, 2]),
+            # static_value: mai triggera resolver
+            ("#__v", [1, 2]),
+            ("#a.type", ["int", "str"]),
+            ("#k,#v", [("a", 1), ("b", 2)]),
+            ("#k,#a.type", [("a", "int"), ("b", "str")]),
+        ],
+    )
+    def test_query_and_digest_what_specs(self, what, expected):
+        """query(what) e digest(what) estraggono le colonne richieste dalla spec.
+
+        '#k' label, '#v' valore, '#__v' static value, '#a.name' attributo;
+        piu' colonne separate da ',' producono tuple.
+        """
         bag = Bag()
         bag.set_item("a", 1, _attributes={"type": "int"})
         bag.set_item("b", 2, _attributes={"type": "str"})
-        assert bag.query("#a.type") == ["int", "str"]
+        args = () if what is None else (what,)
+        assert bag.query(*args) == expected
+        assert bag.digest(*args) == expected
 
     def test_query_deep_paths(self):
         """query('#p', deep=True) ritorna tutti i path in modalita' ricorsiva."""
@@ -383,10 +408,9 @@ class TestQuery:
         result = bag.query("#k", condition=lambda n: n.value > 1)
         assert result == ["b", "c"]
 
-    def test_query_limit(self):
+    def test_query_limit(self, abcd_bag):
         """query(limit=N) tronca il risultato a N elementi."""
-        bag = Bag({"a": 1, "b": 2, "c": 3, "d": 4})
-        assert bag.query("#k", limit=2) == ["a", "b"]
+        assert abcd_bag.query("#k", limit=2) == ["a", "b"]
 
     def test_query_iter_returns_generator(self):
         """query(iter=True) ritorna un generatore, non una lista."""
@@ -409,11 +433,6 @@ class TestQuery:
         assert isinstance(result[0], BagNode)
         assert result[0].label == "a"
 
-    def test_query_static_value(self):
-        """query('#__v') ritorna lo static_value (mai triggera resolver)."""
-        bag = Bag({"a": 1})
-        assert bag.query("#__v") == [1]
-
     def test_query_where_colon_what_syntax(self):
         """query('subpath:what') esegue la query su una sotto-Bag.
 
@@ -426,14 +445,15 @@ class TestQuery:
         result = bag.query("users:#k,#v")
         assert result == [("alice", "a@x.com"), ("bob", "b@x.com")]
 
-    def test_query_inner_value_path_on_bag_value(self):
+    def test_query_inner_value_path_on_bag_value(self, people):
         """query('#v.key') estrae chiave specifica dal value quando e' dict-like.
 
         Scenario: collezione di record, si vuole una sola colonna.
         """
         bag = Bag()
-        bag.set_item("r1", Bag({"name": "alice", "age": 30}))
-        bag.set_item("r2", Bag({"name": "bob", "age": 25}))
+        alice, bob = people
+        bag.set_item("r1", alice)
+        bag.set_item("r2", bob)
         assert bag.query("#v.name") == ["alice", "bob"]
 
     def test_query_custom_key_reads_from_value_dict(self):
@@ -576,28 +596,19 @@ class TestSum:
 class TestSort:
     def test_sort_by_label_ascending_default(self):
         """sort('#k') ordina per label ascendente (default)."""
-        bag = Bag()
-        bag["c"] = 1
-        bag["a"] = 2
-        bag["b"] = 3
+        bag = Bag({"c": 1, "a": 2, "b": 3})
         bag.sort("#k")
         assert bag.keys() == ["a", "b", "c"]
 
     def test_sort_by_label_descending(self):
         """sort('#k:d') ordina per label discendente."""
-        bag = Bag()
-        bag["a"] = 1
-        bag["c"] = 2
-        bag["b"] = 3
+        bag = Bag({"a": 1, "c": 2, "b": 3})
         bag.sort("#k:d")
         assert bag.keys() == ["c", "b", "a"]
 
     def test_sort_by_value_ascending(self):
         """sort('#v') ordina per valore."""
-        bag = Bag()
-        bag["a"] = 3
-        bag["b"] = 1
-        bag["c"] = 2
+        bag = Bag({"a": 3, "b": 1, "c": 2})
         bag.sort("#v")
         assert bag.values() == [1, 2, 3]
 
@@ -37,6 +37,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 from pathlib import Path
+from xml.sax import SAXParseException
 
 import pytest
 
@@ -192,6 +193,19 @@ class TestToXmlAttributes:
         # l'attributo None viene rimosso, non appare
         assert "nil=" not in xml
 
+    def test_special_characters_escaped(self):
+        """caratteri speciali in testo e attributi vengono escapati e
+        sopravvivono al roundtrip."""
+        bag = Bag()
+        bag.set_item("e", "a < b & c", _attributes={"q": 'say "hi"', "nl": "x\ny"})
+        xml = bag.to_xml() or ""
+        assert "a &lt; b &amp; c" in xml
+        assert 'q=\'say "hi"\'' in xml
+        assert 'nl="x&#10;y"' in xml
+        restored = Bag.from_xml(xml)
+        assert restored.get_item("e") == "a < b & c"
+        assert restored.get_attr("e", "q") == 'say "hi"'
+
 
 # =============================================================================
 # 5. to_xml - nested
@@ -235,11 +249,30 @@ class TestFromXmlPlain:
         assert bag.get_attr("root.item", "id") == "x"
         assert bag.get_attr("root.item", "kind") == "small"
 
+    def test_attribute_values_decoded_through_tytx(self):
+        """Attributi con suffisso ::TYPE o letterali JSON vengono decodificati,
+        le stringhe semplici restano tali."""
+        bag = Bag.from_xml(
+            '<root><item n="42::L" d="2025-01-15::D" j="12" f="true" s="row"/></root>'
+        )
+        attr = bag.get_node("root.item").attr
+        assert attr["n"] == 42
+        assert attr["d"].isoformat() == "2025-01-15"
+        assert attr["j"] == 12
+        assert attr["f"] is True
+        assert attr["s"] == "row"
+
     def test_bytes_source_decoded(self):
         """from_xml accetta bytes (UTF-8)."""
         bag = Bag.from_xml(b"<root><a>1</a></root>")
         assert bag.get_item("root.a") == "1"
 
+    def test_bytes_source_honours_declared_encoding(self):
+        """from_xml(bytes) usa l'encoding dichiarato nella XML declaration."""
+        xml = '<?xml version="1.0" encoding="ISO-8859-1"?><root><a>caffè</a></root>'
+        bag = Bag.from_xml(xml.encode("latin-1"))
+        assert bag.get_item("root.a") == "caffè"
+
 
 # =============================================================================
 # 7. from_xml - legacy GenRoBag auto-detect
@@ -494,6 +527,24 @@ class TestFromXmlExtra:
                 raise_on_error=True,
             )
 
+    def test_malformed_xml_raises_sax_parse_exception(self):
+        """XML malformato solleva SAXParseException con la posizione."""
+        with pytest.raises(SAXParseException) as exc:
+            Bag.from_xml("<a><b></a>")
+        assert exc.value.getLineNumber() == 1
+        assert exc.value.getColumnNumber() == 8
+
+    def test_external_entities_are_not_loaded(self, tmp_path):
+        """Le entita' esterne vengono saltate, mai lette (no XXE)."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("SECRET")
+        xml = (
+            f'<!DOCTYPE a [<!ENTITY x SYSTEM "{secret.as_uri()}">]>'
+            "<a>q&x;z</a>"
+        )
+        bag = Bag.from_xml(xml)
+        assert bag.get_item("a") == "qz"
+
 
 # =============================================================================
 # 18. XML tag sanitization (label Python validi ma invalidi come tag XML)
@@ -41,6 +41,24 @@ import pytest
 
 from genro_bag import Bag, BagNode
 
+# buffer eventi condiviso: azzerato in place dal fixture ``events``
+_EVENTS: list = []
+
+# sequenza attesa da un subscriber any= su insert, update, delete
+_EXPECTED_ANY = ("ins", "upd_value", "del")
+
+
+@pytest.fixture
+def events():
+    """Lista eventi vuota, riusata tra i test (clear invece di riallocare).
+
+    Svuotata anche a fine test: un test che non chiede il fixture non
+    trova mai eventi lasciati da un altro.
+    """
+    _EVENTS.clear()
+    yield _EVENTS
+    _EVENTS.clear()
+
 
 # =============================================================================
 # 1. subscribe(update=...)
@@ -48,23 +66,35 @@ from genro_bag import Bag, BagNode
 
 
 class TestUpdateSubscription:
-    def test_update_callback_fires_on_value_change(self):
+    def test_update_callback_fires_on_value_change(self, events):
         """Modificare il valore di un nodo esistente triggera il callback update."""
-        events = []
         bag = Bag()
         bag["a"] = 1
-        bag.subscribe("s1", update=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", update=lambda evt, **_: events.append(evt))
         bag["a"] = 2
         assert events == ["upd_value"]
 
-    def test_update_not_fired_on_insert(self):
+    def test_update_not_fired_on_insert(self, events):
         """Un insert non triggera il callback update."""
-        events = []
         bag = Bag()
-        bag.subscribe("s1", update=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", update=lambda evt, **_: events.append(evt))
         bag["new"] = 1
         assert events == []
 
+    def test_fired_value_notifies_once_then_resets(self, events):
+        """set_item(_fired=True) emette un solo evento col valore, poi torna None.
+
+        Il subscriber vede il valore 'sparato' sul nodo al momento della notifica.
+        """
+        bag = Bag()
+        bag["click"] = None
+        bag.subscribe(
+            "s1", update=lambda evt, node, **_: events.append((evt, node.value))
+        )
+        bag.set_item("click", "left", _fired=True)
+        assert events == [("upd_value", "left")]
+        assert bag["click"] is None
+
 
 # =============================================================================
 # 2. subscribe(insert=...)
@@ -72,20 +102,18 @@ class TestUpdateSubscription:
 
 
 class TestInsertSubscription:
-    def test_insert_callback_fires_on_new_node(self):
+    def test_insert_callback_fires_on_new_node(self, events):
         """Assegnare un path nuovo triggera il callback insert."""
-        events = []
         bag = Bag()
-        bag.subscribe("s1", insert=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", insert=lambda evt, **_: events.append(evt))
         bag["a"] = 1
         assert events == ["ins"]
 
-    def test_insert_not_fired_on_update(self):
+    def test_insert_not_fired_on_update(self, events):
         """Modificare un nodo esistente non triggera insert."""
-        events = []
         bag = Bag()
         bag["a"] = 1
-        bag.subscribe("s1", insert=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", insert=lambda evt, **_: events.append(evt))
         bag["a"] = 2
         assert events == []
 
@@ -96,21 +124,19 @@ class TestInsertSubscription:
 
 
 class TestDeleteSubscription:
-    def test_delete_callback_fires_on_pop(self):
+    def test_delete_callback_fires_on_pop(self, events):
         """pop/del triggerano il callback delete."""
-        events = []
         bag = Bag()
         bag["a"] = 1
-        bag.subscribe("s1", delete=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", delete=lambda evt, **_: events.append(evt))
         bag.pop("a")
         assert events == ["del"]
 
-    def test_delete_callback_fires_on_del_item(self):
+    def test_delete_callback_fires_on_del_item(self, events):
         """del bag[path] triggera il callback delete."""
-        events = []
         bag = Bag()
         bag["a"] = 1
-        bag.subscribe("s1", delete=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", delete=lambda evt, **_: events.append(evt))
         del bag["a"]
         assert events == ["del"]
 
@@ -121,15 +147,14 @@ class TestDeleteSubscription:
 
 
 class TestAnySubscription:
-    def test_any_callback_fires_on_all_three(self):
+    def test_any_callback_fires_on_all_three(self, events):
         """any=... copre update + insert + delete (non timer/transaction)."""
-        events = []
         bag = Bag()
-        bag.subscribe("s1", any=lambda **kw: events.append(kw["evt"]))
+        bag.subscribe("s1", any=lambda evt, **_: events.append(evt))
         bag["a"] = 1         # ins
         bag["a"] = 2         # upd
         bag.pop("a")         # del
-        assert events == ["ins", "upd_value", "del"]
+        assert tuple(events) == _EXPECTED_ANY
 
 
 # =============================================================================
@@ -142,7 +167,7 @@ class TestSubscribeEnablesBackref:
         """subscribe attiva backref se non gia' attivo."""
         bag = Bag()
         assert bag.backref is False
-        bag.subscribe("s1", update=lambda **kw: None)
+        bag.subscribe("s1", update=lambda **_: None)
         assert bag.backref is True
 
 
@@ -167,29 +192,27 @@ class TestSubscribeNoCallback:
 
 
 class TestUnsubscribeSelective:
-    def test_unsubscribe_update_only(self):
+    def test_unsubscribe_update_only(self, events):
         """unsubscribe(update=True) rimuove solo la callback update."""
-        events: list[str] = []
         bag = Bag()
         bag.subscribe(
             "s1",
-            update=lambda **kw: events.append("u"),
-            insert=lambda **kw: events.append("i"),
+            update=lambda **_: events.append("u"),
+            insert=lambda **_: events.append("i"),
         )
         bag.unsubscribe("s1", update=True)
         bag["a"] = 1  # insert -> 'i'
         bag["a"] = 2  # update -> non piu' registrato
         assert events == ["i"]
 
-    def test_unsubscribe_insert_only_keeps_others(self):
+    def test_unsubscribe_insert_only_keeps_others(self, events):
         """unsubscribe(insert=True) preserva update e delete."""
-        events: list[str] = []
         bag = Bag()
         bag.subscribe(
             "s1",
-            insert=lambda **kw: events.append("i"),
-            update=lambda **kw: events.append("u"),
-            delete=lambda **kw: events.append("d"),
+            insert=lambda **_: events.append("i"),
+            update=lambda **_: events.append("u"),
+            delete=lambda **_: events.append("d"),
         )
         bag.unsubscribe("s1", insert=True)
         bag["a"] = 1     # insert -> non registrato
@@ -197,6 +220,24 @@ class TestUnsubscribeSelective:
         bag.pop("a")     # delete
         assert events == ["u", "d"]
 
+    def test_unsubscribe_during_dispatch_applies_from_next_event(self, events):
+        """Un callback che rimuove un altro subscriber non altera il dispatch in corso.
+
+        L'evento corrente raggiunge tutti i subscriber registrati al suo inizio;
+        la rimozione vale dall'evento successivo.
+        """
+        bag = Bag()
+
+        def first(**_):
+            events.append("first")
+            bag.unsubscribe("second", insert=True)
+
+        bag.subscribe("first", insert=first)
+        bag.subscribe("second", insert=lambda **_: events.append("second"))
+        bag["a"] = 1
+        bag["b"] = 2
+        assert events == ["first", "second", "first"]
+
 
 # =============================================================================
 # 8. unsubscribe(any=True) NON tocca transaction
@@ -204,14 +245,13 @@ class TestUnsubscribeSelective:
 
 
 class TestUnsubscribeAny:
-    def test_unsubscribe_any_removes_upd_ins_del_keeps_transaction(self):
+    def test_unsubscribe_any_removes_upd_ins_del_keeps_transaction(self, events):
         """any=True rimuove upd/ins/del/timer ma NON transaction."""
-        events: list[str] = []
         bag = Bag()
         bag.subscribe(
             "s1",
-            any=lambda **kw: events.append(kw["evt"]),
-            transaction=lambda **kw: events.append("txn"),
+            any=lambda evt, **_: events.append(evt),
+            transaction=lambda **_: events.append("txn"),
         )
         bag.unsubscribe("s1", any=True)
 
@@ -220,14 +260,13 @@ class TestUnsubscribeAny:
         # upd/ins/del sono stati rimossi; transaction ancora attivo
         assert events == ["txn"]
 
-    def test_unsubscribe_transaction_only(self):
+    def test_unsubscribe_transaction_only(self, events):
         """unsubscribe(transaction=True) rimuove solo transaction."""
-        events: list[str] = []
         bag = Bag()
         bag.subscribe(
             "s1",
-            any=lambda **kw: events.append(kw["evt"]),
-            transaction=lambda **kw: events.append("txn"),
+            any=lambda evt, **_: events.append(evt),
+            transaction=lambda **_: events.append("txn"),
         )
         bag.unsubscribe("s1", transaction=True)
         with bag.transaction():
@@ -243,46 +282,43 @@ class TestUnsubscribeAny:
 
 
 class TestCallbackArguments:
-    def test_update_callback_receives_evt_node_pathlist_oldvalue(self):
+    def test_update_callback_receives_evt_node_pathlist_oldvalue(self, events):
         """Il callback update riceve evt, node, pathlist, oldvalue, reason."""
-        captured: list[dict] = []
         bag = Bag()
         bag["a"] = "old"
-        bag.subscribe("s1", update=lambda **kw: captured.append(kw))
+        bag.subscribe("s1", update=lambda **kw: events.append(kw))
         bag["a"] = "new"
 
-        assert len(captured) == 1
-        kw = captured[0]
+        assert len(events) == 1
+        kw = events[0]
         assert kw["evt"] == "upd_value"
         assert kw["node"].label == "a"
         assert kw["oldvalue"] == "old"
         assert "pathlist" in kw
         assert "reason" in kw
 
-    def test_insert_callback_receives_evt_node_pathlist_ind(self):
+    def test_insert_callback_receives_evt_node_pathlist_ind(self, events):
         """Il callback insert riceve evt, node, pathlist, ind, reason."""
-        captured: list[dict] = []
         bag = Bag()
-        bag.subscribe("s1", insert=lambda **kw: captured.append(kw))
+        bag.subscribe("s1", insert=lambda **kw: events.append(kw))
         bag["first"] = 1
 
-        assert len(captured) == 1
-        kw = captured[0]
+        assert len(events) == 1
+        kw = events[0]
         assert kw["evt"] == "ins"
         assert kw["node"].label == "first"
         assert kw["ind"] == 0
         assert "pathlist" in kw
 
-    def test_delete_callback_receives_evt_node_pathlist_ind(self):
+    def test_delete_callback_receives_evt_node_pathlist_ind(self, events):
         """Il callback delete riceve evt, node, pathlist, ind, reason."""
-        captured: list[dict] = []
         bag = Bag()
         bag["x"] = 1
-        bag.subscribe("s1", delete=lambda **kw: captured.append(kw))
+        bag.subscribe("s1", delete=lambda **kw: events.append(kw))
         bag.pop("x", _reason="cleanup")
 
-        assert len(captured) == 1
-        kw = captured[0]
+        assert len(events) == 1
+        kw = events[0]
         assert kw["evt"] == "del"
         assert kw["ind"] == 0
         assert kw["reason"] == "cleanup"
@@ -294,11 +330,10 @@ class TestCallbackArguments:
 
 
 class TestEventPropagation:
-    def test_change_in_child_notifies_root(self):
+    def test_change_in_child_notifies_root(self, events):
         """Una modifica su un nodo di sub-Bag arriva al subscriber del root."""
-        events: list = []
         root = Bag()
-        root.subscribe("root_sub", update=lambda **kw: events.append(kw["pathlist"]))
+        root.subscribe("root_sub", update=lambda pathlist, **_: events.append(pathlist))
         # creo sub-bag e la aggancio
         root["outer.inner"] = 1
         # modifica foglia profonda
@@ -308,12 +343,11 @@ class TestEventPropagation:
         # la pathlist contiene la sequenza dei label fino alla foglia modificata
         assert events[0] == ["outer", "inner"]
 
-    def test_insert_in_child_notifies_root(self):
+    def test_insert_in_child_notifies_root(self, events):
         """Un insert in sub-Bag propaga al root."""
-        events: list = []
         root = Bag()
         root["outer.x"] = 1  # crea sub-bag 'outer'
-        root.subscribe("root_sub", insert=lambda **kw: events.append(kw["node"].label))
+        root.subscribe("root_sub", insert=lambda node, **_: events.append(node.label))
         root["outer.y"] = 2
 
         assert "y" in events
@@ -325,11 +359,8 @@ class TestEventPropagation:
 
 
 class TestPropagationStop:
-    def test_false_stops_bubbling_to_parent(self):
+    def test_false_stops_bubbling_to_parent(self, events):
         """Un callback che ritorna False blocca la propagazione al parent."""
-        root_events: list = []
-        child_events: list = []
-
         root = Bag()
         root["outer.x"] = 0
         child = root.get_item("outer")
@@ -338,14 +369,14 @@ class TestPropagationStop:
         # subscriber sul child che blocca; subscriber sul root che NON deve vedere
         child.subscribe(
             "child_sub",
-            update=lambda **kw: (child_events.append(kw["evt"]), False)[1],
+            update=lambda evt, **_: (events.append(("child", evt)), False)[1],
         )
-        root.subscribe("root_sub", update=lambda **kw: root_events.append(kw["evt"]))
+        root.subscribe("root_sub", update=lambda evt, **_: events.append(("root", evt)))
 
         root["outer.x"] = 1
 
-        assert child_events == ["upd_value"]
-        assert root_events == []  # bloccato
+        # nessun evento 'root': bloccato
+        assert events == [("child", "upd_value")]
 
 
 # =============================================================================
@@ -354,61 +385,56 @@ class TestPropagationStop:
 
 
 class TestTransaction:
-    def test_mutations_coalesced_into_single_event(self):
+    def test_mutations_coalesced_into_single_event(self, events):
         """Mutazioni dentro un with transaction() arrivano in un unico evento."""
-        received: list[list] = []
         bag = Bag()
-        bag.subscribe("s1", transaction=lambda **kw: received.append(kw["mutations"]))
+        bag.subscribe("s1", transaction=lambda mutations, **_: events.append(mutations))
 
         with bag.transaction():
             bag["a"] = 1
             bag["b"] = 2
             bag["c"] = 3
 
-        assert len(received) == 1
-        mutations = received[0]
+        assert len(events) == 1
+        mutations = events[0]
         assert len(mutations) == 3
         # ciascun item e' una tupla con il tipo di evento come primo elemento
         event_kinds = [m[0] for m in mutations]
         assert event_kinds == ["ins", "ins", "ins"]
 
-    def test_granular_subscribers_silenced_inside_transaction(self):
+    def test_granular_subscribers_silenced_inside_transaction(self, events):
         """Dentro un with, i callback granulari update/insert/delete non sono chiamati."""
-        granular: list[str] = []
-        txn_received: list = []
         bag = Bag()
         bag.subscribe(
             "s1",
-            any=lambda **kw: granular.append(kw["evt"]),
-            transaction=lambda **kw: txn_received.append(len(kw["mutations"])),
+            any=lambda evt, **_: events.append(evt),
+            transaction=lambda mutations, **_: events.append(("txn", len(mutations))),
         )
         with bag.transaction():
             bag["a"] = 1
             bag["b"] = 2
 
-        assert granular == []
-        assert txn_received == [2]
+        # solo l'evento transaction, nessun granulare
+        assert events == [("txn", 2)]
 
-    def test_exception_inside_with_suppresses_transaction_event(self):
+    def test_exception_inside_with_suppresses_transaction_event(self, events):
         """Se il body del with solleva, nessun evento transaction viene emesso."""
-        txn_received: list = []
         bag = Bag()
-        bag.subscribe("s1", transaction=lambda **kw: txn_received.append(kw))
+        bag.subscribe("s1", transaction=lambda **kw: events.append(kw))
 
         with pytest.raises(RuntimeError):
             with bag.transaction():
                 bag["a"] = 1
                 raise RuntimeError("boom")
 
-        assert txn_received == []
+        assert events == []
         # la mutazione gia' applicata resta (no rollback documentato)
         assert bag.get_item("a") == 1
 
-    def test_nested_transactions_emit_separate_events(self):
+    def test_nested_transactions_emit_separate_events(self, events):
         """Ogni with innestato emette il proprio evento transaction."""
-        received: list[list] = []
         bag = Bag()
-        bag.subscribe("s1", transaction=lambda **kw: received.append(kw["mutations"]))
+        bag.subscribe("s1", transaction=lambda mutations, **_: events.append(mutations))
 
         with bag.transaction():
             bag["outer1"] = 1
@@ -418,9 +444,9 @@ class TestTransaction:
             bag["outer2"] = 4
 
         # due eventi: prima l'inner (chiude prima), poi l'outer
-        assert len(received) == 2
-        assert len(received[0]) == 2  # inner: 2 mutations
-        assert len(received[1]) == 2  # outer: 2 mutations (outer1, outer2)
+        assert len(events) == 2
+        assert len(events[0]) == 2  # inner: 2 mutations
+        assert len(events[1]) == 2  # outer: 2 mutations (outer1, outer2)
 
 
 # =============================================================================
@@ -448,11 +474,25 @@ class TestSetBackref:
         """Dopo che subscribe attiva backref, fullpath riflette la gerarchia."""
         root = Bag()
         root["outer.inner"] = 1
-        root.subscribe("s1", update=lambda **kw: None)
+        root.subscribe("s1", update=lambda **_: None)
         outer = root.get_item("outer")
         assert isinstance(outer, Bag)
         assert outer.fullpath == "outer"
 
+    def test_root_of_deeply_nested_bag_follows_reparenting(self):
+        """root risale la catena di parent, anche dopo uno spostamento del ramo."""
+        root = Bag()
+        root["a.b.c.d"] = 1
+        root.set_backref()
+        deepest = root.get_item("a.b.c")
+        assert isinstance(deepest, Bag)
+        assert deepest.root is root
+        # il ramo 'a' viene agganciato sotto un'altra radice
+        other = Bag()
+        other.set_backref()
+        other["x"] = root.pop("a")
+        assert deepest.root is other
+
 
 # =============================================================================
 # 17. subscribe(timer=...) senza interval solleva
@@ -464,7 +504,7 @@ class TestTimerValidation:
         """subscribe(timer=cb) senza interval solleva ValueError."""
         bag = Bag()
         with pytest.raises(ValueError):
-            bag.subscribe("s1", timer=lambda **kw: None)
+            bag.subscribe("s1", timer=lambda **_: None)
 
 
 # =============================================================================
@@ -473,13 +513,12 @@ class TestTimerValidation:
 
 
 class TestClearWithBackref:
-    def test_clear_of_nested_bag_notifies_parent_with_oldvalue(self):
+    def test_clear_of_nested_bag_notifies_parent_with_oldvalue(self, events):
         """Una clear() su sub-Bag annidata con backref emette upd_value sul parent.
 
         oldvalue e' un Bag orfano con il contenuto precedente (snapshot).
         Scenario: reset atomico di una sezione con watcher esterno.
         """
-        events: list[dict] = []
         root = Bag()
         root["section.a"] = 1
         root["section.b"] = 2
@@ -503,7 +542,7 @@ class TestClearWithBackref:
         """Dopo clear() su sub-Bag annidata, la sub-Bag e' vuota."""
         root = Bag()
         root["section.a"] = 1
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         section = root.get_item("section")
         assert isinstance(section, Bag)
         section.clear()
@@ -520,7 +559,7 @@ class TestDeepHierarchy:
         """fullpath di una foglia a 3 livelli: outer.middle.inner."""
         root = Bag()
         root["a.b.c"] = 42
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         middle = root.get_item("a.b")
         assert isinstance(middle, Bag)
         assert middle.fullpath == "a.b"
@@ -529,7 +568,7 @@ class TestDeepHierarchy:
         """bag.root dal nodo piu' profondo risale fino alla radice."""
         root = Bag()
         root["a.b.c.d"] = 42
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         deepest = root.get_item("a.b.c")
         assert isinstance(deepest, Bag)
         assert deepest.root is root
@@ -539,7 +578,7 @@ class TestDeepHierarchy:
         root = Bag()
         root["section.inner"] = "v"
         root.set_attr("section", kind="form")
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         section = root.get_item("section")
         assert isinstance(section, Bag)
         assert section.attributes.get("kind") == "form"
@@ -559,7 +598,7 @@ class TestBagGetInheritedAttributes:
         root = Bag()
         root["outer.inner"] = "v"
         root.set_attr("outer", permission="read")
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         inner_bag = root.get_item("outer.inner")
         # 'outer.inner' non e' un Bag ma un valore scalare; richiede che
         # testiamo il meccanismo a livello di un container interno
@@ -568,7 +607,7 @@ class TestBagGetInheritedAttributes:
         deep = Bag()
         deep["k"] = 1
         root2.set_item("section", deep, _attributes={"permission": "write"})
-        root2.subscribe("w", update=lambda **kw: None)
+        root2.subscribe("w", update=lambda **_: None)
         section = root2.get_item("section")
         assert isinstance(section, Bag)
         inherited = section.get_inherited_attributes()
@@ -585,7 +624,7 @@ class TestRelativePath:
         """bag.relative_path(leaf_node) ritorna il path dal bag al nodo."""
         root = Bag()
         root["a.b.c"] = 42
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         leaf = root.get_node("a.b.c")
         assert isinstance(leaf, BagNode)
         assert root.relative_path(leaf) == "a.b.c"
@@ -594,7 +633,7 @@ class TestRelativePath:
         """Path relativo dall'intermedio al figlio diretto."""
         root = Bag()
         root["outer.inner.leaf"] = 1
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         outer = root.get_item("outer")
         assert isinstance(outer, Bag)
         leaf = root.get_node("outer.inner.leaf")
@@ -622,7 +661,7 @@ class TestClearBackref:
         """clear_backref() disabilita il backref anche sulle sub-Bag."""
         root = Bag()
         root["section.inner"] = 1
-        root.subscribe("w", update=lambda **kw: None)
+        root.subscribe("w", update=lambda **_: None)
         section = root.get_item("section")
         assert isinstance(section, Bag)
         assert section.backref is True  # ereditato da root
@@ -637,11 +676,10 @@ class TestClearBackref:
 
 
 class TestAutocreateWithSubscribers:
-    def test_autocreate_fires_insert_event(self):
+    def test_autocreate_fires_insert_event(self, events):
         """get_node(path, autocreate=True) su Bag con backref emette ins event."""
-        events: list = []
         bag = Bag()
-        bag.subscribe("w", insert=lambda **kw: events.append(kw["node"].label))
+        bag.subscribe("w", insert=lambda node, **_: events.append(node.label))
         bag.get_node("newnode", autocreate=True)
         assert "newnode" in events
 
@@ -652,7 +690,7 @@ class TestAutocreateWithSubscribers:
 
 
 class TestStopPropagationInsertDelete:
-    def test_false_on_child_insert_blocks_parent(self):
+    def test_false_on_child_insert_blocks_parent(self, events):
         """Callback insert sul child che ritorna False blocca la propagazione."""
         root = Bag()
         # creo la sub-Bag 'section' con un nodo preesistente
@@ -660,40 +698,34 @@ class TestStopPropagationInsertDelete:
         section = root.get_item("section")
         assert isinstance(section, Bag)
 
-        root_events: list = []
-        child_events: list = []
         section.subscribe(
             "child_sub",
-            insert=lambda **kw: (child_events.append(kw["node"].label), False)[1],
+            insert=lambda node, **_: (events.append(("child", node.label)), False)[1],
         )
-        root.subscribe("root_sub", insert=lambda **kw: root_events.append(kw["node"].label))
+        root.subscribe("root_sub", insert=lambda node, **_: events.append(("root", node.label)))
 
         # nuovo insert dentro section
         root["section.new"] = 1
 
-        assert child_events == ["new"]
-        assert root_events == []
+        assert events == [("child", "new")]
 
-    def test_false_on_child_delete_blocks_parent(self):
+    def test_false_on_child_delete_blocks_parent(self, events):
         """Callback delete sul child che ritorna False blocca la propagazione."""
         root = Bag()
         root["section.x"] = 0
         section = root.get_item("section")
         assert isinstance(section, Bag)
 
-        root_events: list = []
-        child_events: list = []
         section.subscribe(
             "child_sub",
-            delete=lambda **kw: (child_events.append(kw["node"].label), False)[1],
+            delete=lambda node, **_: (events.append(("child", node.label)), False)[1],
         )
-        root.subscribe("root_sub", delete=lambda **kw: root_events.append(kw["node"].label))
+        root.subscribe("root_sub", delete=lambda node, **_: events.append(("root", node.label)))
 
         # delete dentro section
         root.pop("section.x")
 
-        assert child_events == ["x"]
-        assert root_events == []
+        assert events == [("child", "x")]
 
 
 # =============================================================================
@@ -702,20 +734,19 @@ class TestStopPropagationInsertDelete:
 
 
 class TestTransactionUpdates:
-    def test_update_inside_transaction_captured_as_upd_mutation(self):
+    def test_update_inside_transaction_captured_as_upd_mutation(self, events):
         """Modifiche di valore dentro transaction finiscono nel batch come 'upd'."""
-        received: list[list] = []
         bag = Bag()
         bag["x"] = 1  # pre-esistente
-        bag.subscribe("s1", transaction=lambda **kw: received.append(kw["mutations"]))
+        bag.subscribe("s1", transaction=lambda mutations, **_: events.append(mutations))
 
         with bag.transaction():
             bag["x"] = 99        # update del valore
             bag["new"] = "ins"   # insert
             bag.pop("x")         # delete
 
-        assert len(received) == 1
-        kinds = [m[0] for m in received[0]]
+        assert len(events) == 1
+        kinds = [m[0] for m in events[0]]
         assert kinds == ["upd", "ins", "del"]
 
 
@@ -725,17 +756,16 @@ class TestTransactionUpdates:
 
 
 class TestDeletePropagation:
-    def test_delete_in_child_bubbles_with_pathlist(self):
+    def test_delete_in_child_bubbles_with_pathlist(self, events):
         """pop su una foglia in sub-Bag notifica il root con pathlist."""
-        captured: list[list] = []
         root = Bag()
         root["section.x"] = 1
-        root.subscribe("w", delete=lambda **kw: captured.append(kw["pathlist"]))
+        root.subscribe("w", delete=lambda pathlist, **_: events.append(pathlist))
         root.pop("section.x")
 
-        assert len(captured) == 1
+        assert len(events) == 1
         # pathlist contiene la sequenza di label dal parent fino al nodo cancellato
-        assert captured[0] == ["section"]
+        assert events[0] == ["section"]
 
 
 # =============================================================================
@@ -744,17 +774,16 @@ class TestDeletePropagation:
 
 
 class TestMoveWithBackref:
-    def test_single_move_fires_del_and_ins_events(self):
+    def test_single_move_fires_del_and_ins_events(self, events):
         """move(0, 2) con backref emette prima un del sul nodo spostato e poi un ins."""
-        events: list[str] = []
         bag = Bag()
         bag["a"] = 1
         bag["b"] = 2
         bag["c"] = 3
         bag.subscribe(
             "w",
-            delete=lambda **kw: events.append(f"del:{kw['node'].label}"),
-            insert=lambda **kw: events.append(f"ins:{kw['node'].label}"),
+            delete=lambda node, **_: events.append(f"del:{node.label}"),
+            insert=lambda node, **_: events.append(f"ins:{node.label}"),
         )
         bag.move(0, 2)
         # 'a' viene prima rimosso e poi reinserito in posizione 2
@@ -763,22 +792,20 @@ class TestMoveWithBackref:
         # ordine finale coerente con la semantica di move
         assert bag.keys() == ["b", "c", "a"]
 
-    def test_single_move_trigger_false_suppresses_events(self):
+    def test_single_move_trigger_false_suppresses_events(self, events):
         """move(..., trigger=False) non emette ins/del events."""
-        events: list[str] = []
         bag = Bag()
         bag["a"] = 1
         bag["b"] = 2
         bag.subscribe(
             "w",
-            any=lambda **kw: events.append(kw["evt"]),
+            any=lambda evt, **_: events.append(evt),
         )
         bag.move(0, 1, trigger=False)
         assert events == []
 
-    def test_multi_move_fires_events_for_each_node(self):
+    def test_multi_move_fires_events_for_each_node(self, events):
         """move([0, 2], 1) con backref emette eventi per ciascun nodo spostato."""
-        events: list[str] = []
         bag = Bag()
         bag["a"] = 1
         bag["b"] = 2
@@ -786,8 +813,8 @@ class TestMoveWithBackref:
         bag["d"] = 4
         bag.subscribe(
             "w",
-            delete=lambda **kw: events.append(f"del:{kw['node'].label}"),
-            insert=lambda **kw: events.append(f"ins:{kw['node'].label}"),
+            delete=lambda node, **_: events.append(f"del:{node.label}"),
+            insert=lambda node, **_: events.append(f"ins:{node.label}"),
         )
         bag.move([0, 2], 1)
         # entrambi i nodi spostati ricevono del + ins
@@ -67,7 +67,7 @@ class TestUpdAttrsModified:
         """Un attributo modificato appare nel diff con old e new entrambi valorizzati."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         bag.subscribe(
             "s1",
             update=lambda **kw: events.append((kw["evt"], kw["attrs_diff"])),
@@ -87,7 +87,7 @@ class TestUpdAttrsRemoved:
         produce un diff con new=None (l'attributo viene rimosso)."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         bag.subscribe(
             "s1",
             update=lambda **kw: events.append((kw["evt"], kw["attrs_diff"])),
@@ -107,7 +107,7 @@ class TestUpdAttrsMultiple:
         tutte le chiavi nel diff."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         bag.subscribe(
             "s1",
             update=lambda **kw: events.append((kw["evt"], kw["attrs_diff"])),
@@ -132,7 +132,7 @@ class TestUpdAttrsNoOp:
         """Settare un attributo allo stesso valore non emette eventi."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         bag.subscribe("s1", update=lambda **kw: events.append(kw["evt"]))
         bag.get_node("x").set_attr(color="red")
         assert events == []
@@ -148,7 +148,7 @@ class TestUpdAttrsTriggerFalse:
         """trigger=False sopprime l'evento anche se ci sono cambi reali."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         bag.subscribe("s1", update=lambda **kw: events.append(kw["evt"]))
         bag.get_node("x").set_attr(color="blue", trigger=False)
         assert events == []
@@ -166,7 +166,7 @@ class TestUpdAttrsReplaceMode:
         chiamata appaiono nel diff come removed (new=None)."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red", size=10)
+        bag.set_item("x", "value", _attributes={"color": "red", "size": 10})
         bag.subscribe(
             "s1",
             update=lambda **kw: events.append((kw["evt"], kw["attrs_diff"])),
@@ -193,7 +193,7 @@ class TestUpdAttrsNodeSubscriber:
         come argomento ``info["attrs_diff"]``."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         node = bag.get_node("x")
         node.subscribe(
             "ns1",
@@ -220,7 +220,7 @@ class TestUpdAttrsBagSubscriber:
         resta None per gli eventi puramente di attributi."""
         events = []
         bag = Bag()
-        bag.set_item("x", "value", color="red")
+        bag.set_item("x", "value", _attributes={"color": "red"})
         bag.subscribe(
             "s1",
             update=lambda **kw: events.append({
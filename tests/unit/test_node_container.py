@@ -0,0 +1,52 @@
+"""Unit test: BagNodeContainer - primitive interne senza API pubblica.
+
+A differenza di tests/spec, qui si esercita direttamente il contenitore
+dei nodi: la cancellazione multipla con chiave a virgola ('a,#2,c') non
+e' raggiungibile da nessuna operazione pubblica di Bag.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from genro_bag import Bag
+
+
+@pytest.fixture
+def abc_bag():
+    """Bag fresca ``{'a': 1, 'b': 2, 'c': 3}``."""
+    return Bag({"a": 1, "b": 2, "c": 3})
+
+
+# =============================================================================
+# 1. __delitem__ con chiave multipla
+# =============================================================================
+
+
+class TestMultiKeyDelete:
+    def test_removes_each_listed_node(self, abc_bag):
+        """'a,c' rimuove esattamente i nodi indicati."""
+        del abc_bag._nodes["a,c"]
+        assert abc_bag.keys() == ["b"]
+
+    def test_repeated_label_removes_node_once(self, abc_bag):
+        """'a,a' rimuove solo 'a', non anche il nodo che ne prende il posto."""
+        del abc_bag._nodes["a,a"]
+        assert abc_bag.keys() == ["b", "c"]
+
+    def test_label_and_index_alias_removes_node_once(self, abc_bag):
+        """'a,#0' indica due volte lo stesso nodo: ne sparisce uno solo."""
+        del abc_bag._nodes["a,#0"]
+        assert abc_bag.keys() == ["b", "c"]
+
+    def test_missing_keys_are_ignored(self, abc_bag):
+        """Chiavi inesistenti nella lista non sollevano e non rimuovono nulla."""
+        del abc_bag._nodes["x,#9"]
+        assert abc_bag.keys() == ["a", "b", "c"]
+
+    def test_label_lookup_follows_delete(self, abc_bag):
+        """Dopo la cancellazione il lookup per label non trova piu' i nodi."""
+        del abc_bag._nodes["a,#2"]
+        assert "a" not in abc_bag
+        assert "c" not in abc_bag
+        assert abc_bag["b"] == 2